@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+RexBox Documentation Generator Benchmark Suite
+rexbox/ 형태의 합성 트리(색상 변수, theme 매핑, breakpoint, 버튼 팔레트 스텝을
+100 / 1k / 10k / 100k 규모로 생성)에서 각 extract_* 함수와 generate_*_page 함수의
+실행 시간을 따로 측정하고 결과를 JSON으로 저장합니다.
+
+사용법:
+    python3 scripts/benchmark-generator.py --output bench.json
+    python3 scripts/benchmark-generator.py --compare bench.json   # 회귀 검사
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).parent / "generate-docs.py"
+REXBOX_DIR = Path(__file__).parent.parent.parent / "rexbox"
+
+DEFAULT_SIZES = "100,1000,10000,100000"
+# 이 규모 이상에서는 한 페이지의 조각이 메모리 예산을 넘으므로 조각 캐시 재사용을 검사
+FRAGMENT_CHECK_MIN_SIZE = 30000
+
+PALETTE_NAMES = [
+    "slate", "gray", "zinc", "neutral", "stone", "lime", "green", "emerald",
+    "teal", "cyan", "sky", "blue", "indigo", "violet", "purple", "fuchsia",
+    "pink", "rose", "red", "orange", "amber", "yellow",
+]
+BUTTON_PALETTES = ["slate", "primary", "secondary", "point"]
+THEME_PREFIXES = ["bg", "text", "border", "link"]
+
+
+# ============================================
+# 합성 rexbox/ 트리
+# ============================================
+
+def color_name(i: int) -> str:
+    return f"{PALETTE_NAMES[i % len(PALETTE_NAMES)]}-{(i // len(PALETTE_NAMES) + 1) * 10}"
+
+
+def write_synthetic_tree(root: Path, size: int) -> None:
+    """실제 rexbox/를 복사한 뒤 규모에 영향을 주는 파일을 size 크기로 덮어씁니다."""
+    shutil.copytree(REXBOX_DIR, root)
+
+    colors = ["$white: #ffffff;", "$black: #000000;"]
+    colors += [f"${color_name(i)}: #{i * 2654435761 % 0xFFFFFF:06x};" for i in range(size)]
+    (root / "variables" / "_colors.scss").write_text("\n".join(colors) + "\n", encoding="utf-8")
+
+    theme = ["@use '../variables/colors' as *;",
+             "$primary: $blue-10 !default;", "$secondary: $slate-10 !default;",
+             "$point: $orange-10 !default;", "$slate: $slate-10 !default;"]
+    theme += [f"${THEME_PREFIXES[i % len(THEME_PREFIXES)]}-{i}: ${color_name(i)} !default;"
+              for i in range(size)]
+    (root / "theme" / "_index.scss").write_text("\n".join(theme) + "\n", encoding="utf-8")
+
+    breakpoints = ",\n".join(f'    "bp-{i}": {320 + i}px' for i in range(size))
+    (root / "breakpoints" / "_index.scss").write_text(f"$bp: (\n{breakpoints}\n);\n", encoding="utf-8")
+
+    buttons = [".btn { display: inline-flex; }", ".btn-primary { color: $primary; }",
+               ".btn-sm { padding: 4px; }", ".btn-lg { padding: 12px; }",
+               ".btn:disabled { opacity: .5; }"]
+    buttons += [f".btn-{BUTTON_PALETTES[i % len(BUTTON_PALETTES)]}-{(i // len(BUTTON_PALETTES) + 1) * 10} {{ color: inherit; }}"
+                for i in range(size)]
+    (root / "utilities" / "_buttons.scss").write_text("\n".join(buttons) + "\n", encoding="utf-8")
+
+
+# ============================================
+# 측정
+# ============================================
+
+def load_generator(root: Path):
+    """합성 트리를 바라보는 새 생성기 모듈 인스턴스를 로드합니다."""
+    os.environ["REXBOX_DIR"] = str(root)
+    try:
+        spec = importlib.util.spec_from_file_location(f"rexbox_generate_docs_{id(root)}", SCRIPT_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        del os.environ["REXBOX_DIR"]
+    module.configure_extract_cache(enabled=False)
+    return module
+
+
+def measure(func, repeat: int, setup=None) -> dict:
+    """wall/CPU 시간(초)의 최솟값을 반환합니다. 매 실행 전에 setup()을 호출합니다."""
+    wall, cpu = [], []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        func()
+        wall.append(time.perf_counter() - start_wall)
+        cpu.append(time.process_time() - start_cpu)
+    return {"wall": min(wall), "cpu": min(cpu)}
+
+
+def extractor_calls(generator):
+    """이름 -> 인자 없이 호출할 수 있는 extract_* 함수"""
+    color_vars = generator.extract_color_variables(generator.VARIABLES_COLORS_FILE)
+    return {
+        "extract_color_variables": lambda: generator.extract_color_variables(generator.VARIABLES_COLORS_FILE),
+        "extract_theme_mappings": lambda: generator.extract_theme_mappings(generator.THEME_FILE, color_vars),
+        "extract_breakpoints": generator.extract_breakpoints,
+        "extract_typography": generator.extract_typography,
+        "extract_spacing": generator.extract_spacing,
+        "extract_fonts": generator.extract_fonts,
+        "extract_borders": generator.extract_borders,
+        "extract_mixins": generator.extract_mixins,
+        "extract_buttons": generator.extract_buttons,
+    }
+
+
+def page_calls(generator):
+    """이름 -> generate_*_page 함수"""
+    return {page.generator.__name__: page.generator for page in generator.PAGES.values()}
+
+
+def run_size(size: int, repeat: int) -> dict:
+    """한 규모에서 모든 extract_* / generate_*_page를 측정합니다.
+
+    매 실행 전에 SCSS 인덱스를 비우므로 각 측정값에는 파일 읽기와 토큰화가 포함됩니다.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "rexbox"
+        write_synthetic_tree(root, size)
+        generator = load_generator(root)
+
+        result = {"extract": {}, "pages": {}}
+        for name, call in extractor_calls(generator).items():
+            result["extract"][name] = measure(call, repeat, generator.reset_scss_index)
+        for name, call in page_calls(generator).items():
+            result["pages"][name] = measure(call, repeat, generator.reset_scss_index)
+        if size >= FRAGMENT_CHECK_MIN_SIZE:
+            result["fragment_cache"] = fragment_cache_check(generator, Path(tmp) / "cache", repeat)
+        return result
+
+
+def fragment_cache_check(generator, cache_dir: Path, repeat: int) -> dict:
+    """Color Palettes 페이지를 반복 렌더링해 메모리 조각 캐시가 재사용되는지 확인합니다.
+
+    디스크 계층은 끄고(조각은 메모리에서만 재사용) 추출 결과는 빌드 내 메모리로만 재사용합니다.
+    """
+    page = "color-palettes.html"
+    uncached = measure(lambda: generator.render_page(page), repeat)
+
+    generator.configure_extract_cache(enabled=True, cache_dir=cache_dir / "extract")
+    try:
+        fragments = generator.get_fragment_cache()
+        fragments.disk = None
+        generator.render_page(page)  # 첫 렌더링으로 채움
+        fragments.hits = fragments.misses = 0
+        cached = measure(lambda: generator.render_page(page), repeat)
+        return {"hits": fragments.hits, "misses": fragments.misses,
+                "wall": cached["wall"], "uncached_wall": uncached["wall"]}
+    finally:
+        generator.configure_extract_cache(enabled=False)
+
+
+# ============================================
+# 결과 저장 / 비교
+# ============================================
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, cwd=SCRIPT_PATH.parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_seconds: float) -> list:
+    """baseline 대비 threshold배 이상 느려진 항목 목록을 반환합니다."""
+    regressions = []
+    for size, groups in results["sizes"].items():
+        for group in ("extract", "pages"):
+            for name, timing in groups[group].items():
+                old = baseline.get("sizes", {}).get(size, {}).get(group, {}).get(name)
+                if old is None or timing["wall"] < min_seconds:
+                    continue
+                ratio = timing["wall"] / max(old["wall"], 1e-9)
+                if ratio >= threshold:
+                    regressions.append((size, name, old["wall"], timing["wall"], ratio))
+    return regressions
+
+
+def print_table(results: dict) -> None:
+    sizes = list(results["sizes"])
+    names = []
+    for group in ("extract", "pages"):
+        for name in results["sizes"][sizes[0]][group]:
+            names.append((group, name))
+    header = f"{'함수':<32}" + "".join(f"{size:>12}" for size in sizes)
+    print(header + "   (wall ms)")
+    print("-" * len(header))
+    for group, name in names:
+        row = f"{name:<32}"
+        for size in sizes:
+            row += f"{results['sizes'][size][group][name]['wall'] * 1000:>12.2f}"
+        print(row)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="문서 생성기 규모별 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"쉼표로 구분한 규모 (기본값: {DEFAULT_SIZES})")
+    parser.add_argument("--repeat", type=int, default=3, help="항목별 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--output", "-o", type=Path, default=Path("benchmark-results.json"),
+                        help="결과 JSON 경로 (기본값: benchmark-results.json)")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE_JSON",
+                        help="이전 결과와 비교해 느려진 항목이 있으면 종료 코드 1을 반환합니다.")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="회귀로 판단할 배율 (기본값: 1.25)")
+    parser.add_argument("--min-ms", type=float, default=1.0,
+                        help="이보다 짧은 측정값은 비교에서 제외 (기본값: 1ms)")
+    args = parser.parse_args()
+
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+    for size in (int(s) for s in args.sizes.split(",")):
+        print(f"규모 {size} 측정 중...", file=sys.stderr)
+        results["sizes"][str(size)] = run_size(size, args.repeat)
+
+    args.output.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print_table(results)
+    print(f"\n✓ 결과 저장: {args.output}")
+
+    thrashing = []
+    for size, groups in results["sizes"].items():
+        check = groups.get("fragment_cache")
+        if check is None:
+            continue
+        print(f"\n조각 캐시 [{size}]: 적중 {check['hits']}, 미스 {check['misses']}, "
+              f"color-palettes {check['uncached_wall'] * 1000:.2f}ms → {check['wall'] * 1000:.2f}ms")
+        if check["hits"] == 0:
+            thrashing.append(size)
+    if thrashing:
+        print(f"✗ 조각 캐시가 재사용되지 않음 (규모 {', '.join(thrashing)})")
+        sys.exit(1)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold, args.min_ms / 1000)
+        if regressions:
+            print(f"\n✗ {baseline.get('revision', '?')} 대비 느려진 항목:")
+            for size, name, old, new, ratio in regressions:
+                print(f"   [{size}] {name}: {old * 1000:.2f}ms → {new * 1000:.2f}ms ({ratio:.2f}x)")
+            sys.exit(1)
+        print(f"\n✓ {baseline.get('revision', '?')} 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+RexBox Documentation Pattern Micro-benchmark
+10k 색상 변수 팔레트에서 정렬 키와 팔레트 카테고리 분류를
+호출마다 정규식을 찾는 방식과 미리 컴파일된 Patterns 레지스트리 방식으로 비교합니다.
+"""
+
+import argparse
+import importlib.util
+import re
+import timeit
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).parent / "generate-docs.py"
+
+
+def load_generator():
+    """generate-docs.py를 모듈로 로드합니다."""
+    spec = importlib.util.spec_from_file_location("rexbox_generate_docs", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_palette(generator, count: int):
+    """(변수 이름, 색상) 목록을 만듭니다."""
+    names = [name.lower() for name in generator.PALETTE_CATEGORY_NAMES[1:]]
+    return [
+        (f"{names[i % len(names)]}-{(i // len(names) + 1) * 10}", f"#{i % 0xFFFFFF:06X}")
+        for i in range(count)
+    ]
+
+
+def legacy_sort(color_list):
+    """이전 구현: 원소마다 re.search(문자열 패턴) 호출"""
+    def get_sort_key(item):
+        match = re.search(r'-(\d+)$', item[0])
+        if match:
+            return (1, int(match.group(1)))
+        return (0, 0)
+    return sorted(color_list, key=get_sort_key)
+
+
+def legacy_categorize(generator, color_list):
+    """이전 구현: 변수마다 모든 카테고리에 대해 cat.lower() + startswith"""
+    categories = {name: [] for name in generator.PALETTE_CATEGORY_NAMES}
+    for var_name, color_value in color_list:
+        for cat in categories.keys():
+            if var_name.startswith(cat.lower()):
+                categories[cat].append((var_name, color_value))
+                break
+    return categories
+
+
+def compiled_categorize(generator, color_list):
+    """현재 구현: 미리 컴파일된 접두사 정규식 한 번으로 판별"""
+    categories = {name: [] for name in generator.PALETTE_CATEGORY_NAMES}
+    category_by_prefix = {name.lower(): name for name in generator.PALETTE_CATEGORY_NAMES}
+    prefix_match = generator.Patterns.PALETTE_CATEGORY_PREFIX.match
+    for var_name, color_value in color_list:
+        match = prefix_match(var_name)
+        if match:
+            categories[category_by_prefix[match.group()]].append((var_name, color_value))
+    return categories
+
+
+def report(label: str, legacy, compiled, number: int, repeat: int) -> None:
+    legacy_time = min(timeit.repeat(legacy, number=number, repeat=repeat)) / number
+    compiled_time = min(timeit.repeat(compiled, number=number, repeat=repeat)) / number
+    print(f"{label:<14} {legacy_time * 1000:>10.2f} {compiled_time * 1000:>10.2f} {legacy_time / compiled_time:>8.2f}x")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="정규식 레지스트리 마이크로 벤치마크")
+    parser.add_argument("--size", type=int, default=10000, help="색상 변수 개수 (기본값: 10000)")
+    parser.add_argument("--number", type=int, default=10, help="측정당 실행 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    generator = load_generator()
+    palette = make_palette(generator, args.size)
+
+    assert legacy_sort(palette) == generator.sort_color_by_brightness(palette)
+    assert legacy_categorize(generator, palette) == compiled_categorize(generator, palette)
+
+    print(f"색상 변수 {args.size}개")
+    print(f"{'항목':<14} {'이전(ms)':>10} {'현재(ms)':>10} {'배율':>9}")
+    report("정렬 키", lambda: legacy_sort(palette),
+           lambda: generator.sort_color_by_brightness(palette), args.number, args.repeat)
+    report("카테고리 분류", lambda: legacy_categorize(generator, palette),
+           lambda: compiled_categorize(generator, palette), args.number, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
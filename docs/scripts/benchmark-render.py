@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+RexBox Documentation Render Benchmark
+팔레트 크기를 늘려 가며 generate_color_palettes_page 렌더링 시간을 측정합니다.
+변수 하나당 시간이 거의 일정하면 렌더링이 선형으로 증가한다는 뜻입니다.
+"""
+
+import argparse
+import importlib.util
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).parent / "generate-docs.py"
+
+# Tailwind 계열 팔레트 이름 (generate_color_palettes_page의 카테고리와 일치)
+PALETTE_NAMES = [
+    "slate", "gray", "zinc", "neutral", "stone", "lime", "green", "emerald",
+    "teal", "cyan", "sky", "blue", "indigo", "violet", "purple", "fuchsia",
+    "pink", "rose", "red", "orange", "amber", "yellow",
+]
+
+
+def load_generator():
+    """generate-docs.py를 모듈로 로드합니다."""
+    spec = importlib.util.spec_from_file_location("rexbox_generate_docs", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_palette(path: Path, count: int) -> None:
+    """색상 변수 count개를 가진 variables/_colors.scss 형태의 파일을 만듭니다."""
+    lines = ["$white: #ffffff;", "$black: #000000;"]
+    for i in range(count):
+        name = PALETTE_NAMES[i % len(PALETTE_NAMES)]
+        step = (i // len(PALETTE_NAMES) + 1) * 10
+        lines.append(f"${name}-{step}: #{i * 2654435761 % 0xFFFFFF:06x};")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def bench(generator, scss_file: Path, repeat: int) -> float:
+    """가장 빠른 실행 시간(초)을 반환합니다."""
+    best = float("inf")
+    for _ in range(repeat):
+        generator.reset_scss_index()
+        start = time.perf_counter()
+        generator.generate_color_palettes_page()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="팔레트 크기에 따른 렌더링 시간 측정")
+    parser.add_argument("--sizes", default="1000,2000,4000,8000,16000,32000",
+                        help="쉼표로 구분한 색상 변수 개수 (기본값: 1000,...,32000)")
+    parser.add_argument("--repeat", type=int, default=3, help="크기별 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    generator = load_generator()
+    generator.configure_extract_cache(enabled=False)
+
+    print(f"{'변수 수':>10} {'시간(ms)':>12} {'µs/변수':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        scss_file = Path(tmp) / "_colors.scss"
+        generator.VARIABLES_COLORS_FILE = scss_file
+        for size in (int(s) for s in args.sizes.split(",")):
+            write_palette(scss_file, size)
+            elapsed = bench(generator, scss_file, args.repeat)
+            print(f"{size:>10} {elapsed * 1000:>12.2f} {elapsed / size * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
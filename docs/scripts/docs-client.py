@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+RexBox Documentation Client
+실행 중인 문서 데몬(generate-docs.py --daemon)에 Unix 소켓으로 재생성을 요청하고 결과를 기다립니다.
+데몬이 없으면 generate-docs.py를 현재 프로세스에서 실행합니다.
+
+사용법:
+    python3 scripts/docs-client.py                                   # 모든 페이지
+    python3 scripts/docs-client.py --changed rexbox/theme/_index.scss  # 의존하는 페이지만
+"""
+
+import argparse
+import importlib.util
+import json
+import socket
+import sys
+from pathlib import Path
+
+SCRIPT_PATH = Path(__file__).parent / "generate-docs.py"
+DEFAULT_SOCKET = Path(__file__).parent.parent / ".cache" / "daemon.sock"
+
+
+def request_daemon(socket_path: Path, request: dict, timeout: float):
+    """데몬에 요청을 보내고 응답을 반환합니다.
+
+    데몬이 없거나 응답하지 않으면(시간 초과, 연결 끊김) None.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        try:
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        except OSError as e:
+            # socket.timeout, ConnectionResetError, BrokenPipeError 모두 OSError
+            print(f"⚠️  데몬이 응답하지 않습니다 ({e or type(e).__name__}). 직접 생성합니다.", file=sys.stderr)
+            return None
+    try:
+        return json.loads(line) if line else None
+    except ValueError:
+        print("⚠️  데몬 응답을 해석할 수 없습니다. 직접 생성합니다.", file=sys.stderr)
+        return None
+
+
+def build_in_process(changed):
+    """데몬 없이 생성기를 직접 실행합니다."""
+    spec = importlib.util.spec_from_file_location("rexbox_generate_docs", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.main(["--changed", *changed] if changed else [])
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="RexBox 문서 데몬 클라이언트")
+    parser.add_argument("--changed", nargs="+", metavar="PATH",
+                        help="변경된 SCSS 파일 경로. 이 파일에 의존하는 페이지만 다시 생성합니다.")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET, metavar="PATH",
+                        help="데몬 소켓 경로 (기본값: docs/.cache/daemon.sock)")
+    parser.add_argument("--timeout", type=float, default=120.0, metavar="SEC",
+                        help="데몬 응답을 기다리는 최대 시간 (기본값: 120초)")
+    args = parser.parse_args()
+
+    # 데몬은 작업 디렉토리가 다를 수 있으므로 절대 경로로 보냄
+    changed = [str(Path(path).resolve()) for path in args.changed] if args.changed else None
+
+    response = request_daemon(args.socket, {"changed": changed}, args.timeout)
+    if response is None:
+        build_in_process(changed)
+        return
+
+    if response.get("ok"):
+        print(response["output"], end="")
+        print(f"✓ 문서 데몬에서 생성했습니다 ({args.socket})")
+        return
+
+    print(f"⚠️  데몬 오류: {response.get('error')}", file=sys.stderr)
+    if response.get("restart"):
+        # 생성기 코드가 바뀌어 데몬이 종료됨 - 이번에는 직접 생성
+        build_in_process(changed)
+        return
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
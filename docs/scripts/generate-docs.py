@@ -4,13 +4,36 @@ RexBox Documentation Generator
 SCSS 파일들을 파싱하여 다중 페이지 사양서를 자동 생성합니다.
 """
 
+import argparse
+import collections
+import contextlib
+import cProfile
+import functools
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import pickle
+import queue
 import re
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from urllib.parse import urlsplit
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
 # 프로젝트 루트 디렉토리
 # scripts 디렉토리에서 rexbox 디렉토리로의 경로
-ROOT_DIR = Path(__file__).parent.parent.parent / "rexbox"
+# (REXBOX_DIR 환경 변수로 다른 rexbox/ 트리를 지정할 수 있습니다 - 포크, 벤치마크용)
+ROOT_DIR = Path(os.environ.get("REXBOX_DIR") or Path(__file__).parent.parent.parent / "rexbox")
 DOCS_DIR = Path(__file__).parent.parent
 VARIABLES_COLORS_FILE = ROOT_DIR / "variables" / "_colors.scss"
 THEME_FILE = ROOT_DIR / "theme" / "_index.scss"
@@ -18,58 +41,88 @@ BREAKPOINTS_FILE = ROOT_DIR / "breakpoints" / "_index.scss"
 TYPOGRAPHY_FILE = ROOT_DIR / "variables" / "_typo.scss"
 SPACING_FILE = ROOT_DIR / "variables" / "_spacing.scss"
 FONTS_VARIABLES_FILE = ROOT_DIR / "fonts" / "_variables.scss"
+MIXINS_DIR = ROOT_DIR / "mixins"
+MIXIN_FILES = {
+    "rounded": MIXINS_DIR / "_rounded.scss",
+    "backdrop": MIXINS_DIR / "_backdrop.scss",
+    "button-hover": MIXINS_DIR / "_button-hover.scss",
+    "clearfix": MIXINS_DIR / "_clearfix.scss",
+    "ellipsis": MIXINS_DIR / "_ellipsis.scss",
+    "transform": MIXINS_DIR / "_transform.scss",
+    "transition": MIXINS_DIR / "_transition.scss",
+}
 
-# 네비게이션 메뉴 (카테고리별 구조화)
-NAV_CATEGORIES = [
-    {
-        "title": "시작하기",
-        "items": [
-            {"title": "Home", "url": "index.html"},
-            {"title": "Sample", "url": "sample.html"},
-            {"title": "Theme", "url": "theme.html"},
-        ]
-    },
-    {
-        "title": "기본 설정",
-        "items": [
-            {"title": "Color Palettes", "url": "color-palettes.html"},
-            {"title": "Typography", "url": "typography.html"},
-            {"title": "Fonts", "url": "fonts.html"},
-            {"title": "Spacing", "url": "spacing.html"},
-        ]
-    },
-    {
-        "title": "레이아웃",
-        "items": [
-            {"title": "Breakpoints", "url": "breakpoints.html"},
-            {"title": "Container", "url": "container.html"},
-            {"title": "Width", "url": "width.html"},
-            {"title": "Stacks", "url": "stacks.html"},
-        ]
-    },
-    {
-        "title": "컴포넌트",
-        "items": [
-            {"title": "Buttons", "url": "buttons.html"},
-            {"title": "Borders", "url": "borders.html"},
-            {"title": "Vertical Rule", "url": "vertical-rule.html"},
-        ]
-    },
-    {
-        "title": "반응형",
-        "items": [
-            {"title": "Responsive", "url": "responsive.html"},
-        ]
-    },
-    {
-        "title": "개발자 도구",
-        "items": [
-            {"title": "Mixins", "url": "mixins.html"},
-        ]
-    },
+# 추출 결과 캐시 디렉토리
+CACHE_DIR = DOCS_DIR / ".cache"
+
+# ============================================
+# 정규식 레지스트리
+# ============================================
+# 생성기에서 쓰는 모든 정규식은 여기에서 모듈 로드 시 한 번만 컴파일합니다.
+# 그룹은 이름으로 참조합니다 (match.group("name")).
+
+# 색상 팔레트 카테고리 (Color Palettes 페이지 표시 순서의 기본값)
+PALETTE_CATEGORY_NAMES = [
+    'Global',
+    'Slate', 'Gray', 'Zinc', 'Neutral', 'Stone',
+    'Lime', 'Green', 'Emerald', 'Teal', 'Cyan',
+    'Sky', 'Blue', 'Indigo', 'Violet', 'Purple',
+    'Fuchsia', 'Pink', 'Rose', 'Red', 'Orange',
+    'Amber', 'Yellow',
 ]
 
 
+class Patterns:
+    """컴파일된 정규식 모음"""
+
+    # --- SCSS 토큰 ---
+    # $name: value;  (값 안에 다른 "$name:" 선언이 시작되면 끊어서 주석 속 선언을 삼키지 않음)
+    SCSS_VARIABLE = re.compile(r'\$(?P<name>[a-z0-9-]+):\s*(?P<value>(?:(?!\$[a-z0-9-]+:)[^;{}])+);')
+    # "key": value  (map 항목)
+    SCSS_MAP_ENTRY = re.compile(r'"(?P<key>[^"]+)":\s*(?P<value>[^,;()"\s]+)')
+    # @mixin name(params) {
+    SCSS_MIXIN = re.compile(r'@mixin\s+(?P<name>[a-z0-9-]+)\s*(?:\((?P<params>[^)]*)\))?\s*{')
+    # .class-name  (바로 뒤에 "{"가 오면 규칙 선언)
+    SCSS_SELECTOR = re.compile(r'\.(?P<name>[a-zA-Z0-9_-]+)(?P<block>\s*\{)?')
+
+    # --- 변수 값 ---
+    HEX_COLOR_VALUE = re.compile(r'(?P<color>#[0-9a-fA-F]{3,6}|#[0-9a-fA-F]{8})\s*')
+    CATEGORY_COLOR_VALUE = re.compile(r'#[0-9a-fA-F]{3,8}\s*')
+    THEME_MAPPING_VALUE = re.compile(r'\$(?P<base>[a-z0-9-]+)\s*(?:!default)?\s*')
+    PX_VALUE = re.compile(r'\d+px')
+    REM_CALL_VALUE = re.compile(r'rem\((?P<px>\d+)\)')
+
+    # --- 변수 / 클래스 이름 ---
+    STEP_SUFFIX = re.compile(r'-(?P<step>\d+)$')
+    PALETTE_CATEGORY_PREFIX = re.compile('|'.join(re.escape(name.lower()) for name in PALETTE_CATEGORY_NAMES))
+    FONT_SIZE_NAME = re.compile(r'font-size-(?P<key>[a-z0-9-]+)')
+    FONT_WEIGHT_NAME = re.compile(r'font-weight-(?P<key>[a-z]+)')
+    SPACING_NAME = re.compile(r'[a-z]+')
+    BORDER_WIDTH_CLASS = re.compile(r'border-[0-5]')
+    BORDER_COLOR_CLASS = re.compile(r'border-(?:primary|secondary|success|warning|danger|info|light|dark|white|black|positive|negative|neutral)')
+    BORDER_RADIUS_CLASS = re.compile(r'rounded(?:-[a-z0-9-]+)?')
+    BORDER_OPACITY_CLASS = re.compile(r'border-opacity-(?:0|10|25|50|75|100)')
+    BUTTON_VARIANT_CLASS = re.compile(r'btn-(?P<variant>[a-z]+)')
+    DIGITS = re.compile(r'\d+')
+
+
+class HtmlBuilder:
+    """HTML 조각을 리스트에 모았다가 한 번에 합치는 빌더
+
+    루프 안에서 content += f"..." 로 문자열을 이어 붙이면 페이지 크기에 대해
+    이차 시간이 들 수 있으므로, 모든 페이지 생성 함수는 이 빌더에 조각을 씁니다.
+    """
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, *fragments: str):
+        self._parts: List[str] = list(fragments)
+
+    def write(self, fragment: str) -> None:
+        self._parts.append(fragment)
+
+    def getvalue(self) -> str:
+        return "".join(self._parts)
 
 
 def get_navigation(current_page: str = "", page_title: str = "") -> str:
@@ -77,7 +130,7 @@ def get_navigation(current_page: str = "", page_title: str = "") -> str:
     # 항상 "RexBox"로 통일
     current_title = "RexBox"
     
-    nav_html = f"""
+    nav_html = HtmlBuilder(f"""
     <aside class="docs-sidebar">
         <div class="docs-sidebar-header">
             <div class="docs-sidebar-title">{current_title}</div>
@@ -88,31 +141,29 @@ def get_navigation(current_page: str = "", page_title: str = "") -> str:
             </a>
         </div>
         <nav class="docs-nav">
-    """
+    """)
     
-    for category in NAV_CATEGORIES:
-        nav_html += f'            <div class="docs-nav-category">\n'
-        nav_html += f'                <div class="docs-nav-category-title">{category["title"]}</div>\n'
-        nav_html += f'                <ul class="docs-nav-list">\n'
+    for category, pages in nav_categories():
+        nav_html.write(f'            <div class="docs-nav-category">\n')
+        nav_html.write(f'                <div class="docs-nav-category-title">{category}</div>\n')
+        nav_html.write(f'                <ul class="docs-nav-list">\n')
         
-        for item in category["items"]:
-            active = ' active' if item["url"] == current_page else ""
-            nav_html += f'                    <li><a href="{item["url"]}" class="docs-nav-link{active}">{item["title"]}</a></li>\n'
+        for page in pages:
+            active = ' active' if page.slug == current_page else ""
+            nav_html.write(f'                    <li><a href="{page.slug}" class="docs-nav-link{active}">{page.title}</a></li>\n')
         
-        nav_html += f'                </ul>\n'
-        nav_html += f'            </div>\n'
+        nav_html.write(f'                </ul>\n')
+        nav_html.write(f'            </div>\n')
     
-    nav_html += """
+    nav_html.write("""
         </nav>
     </aside>
-    """
-    return nav_html
+    """)
+    return nav_html.getvalue()
 
 
-
-
-def generate_html_page(title: str, content: str, current_page: str = "") -> str:
-    """HTML 페이지 생성 (공통 CSS 사용)"""
+def _html_page_template(title: str, navigation: str, content: str) -> str:
+    """공통 HTML 페이지 틀 (공통 CSS 사용)"""
     # SVG favicon (data URI)
     favicon_svg = 'data:image/svg+xml,%3Csvg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"%3E%3Crect width="100" height="100" fill="%231e293b"/%3E%3Ctext x="50" y="70" font-family="monospace" font-size="60" text-anchor="middle" fill="white"%3ES%3C/text%3E%3C/svg%3E'
     
@@ -127,7 +178,7 @@ def generate_html_page(title: str, content: str, current_page: str = "") -> str:
     <link rel="stylesheet" href="css/main.css">
 </head>
 <body>
-    {get_navigation(current_page, title)}
+    {navigation}
     <main class="docs-main">
         <div class="docs-container">
             {content}
@@ -138,79 +189,615 @@ def generate_html_page(title: str, content: str, current_page: str = "") -> str:
 """
 
 
+# 틀을 미리 나눌 때 쓰는 자리 표시자 (페이지 내용에 나올 수 없는 NUL 문자 사용)
+_TITLE_SLOT = "\0title\0"
+_NAV_SLOT = "\0nav\0"
+_CONTENT_SLOT = "\0content\0"
+NAV_ACTIVE_MARKER = " active"
+
+
+class PageShell(NamedTuple):
+    """미리 나눠 둔 페이지 틀: head + 제목 + prefix + active 표시 + suffix + 본문 + tail"""
+    head: str                               # <title> 앞까지
+    slots: Dict[str, Tuple[str, str]]       # 페이지 -> (제목 뒤 ~ 해당 링크의 active 자리, active 자리 뒤 ~ 본문 앞)
+    inactive: Tuple[str, str]               # 레지스트리에 없는 페이지용 (active 표시 없음)
+    tail: str                               # 본문 뒤
+
+
+@functools.lru_cache(maxsize=None)
+def compile_page_shell() -> PageShell:
+    """페이지 틀과 네비게이션을 한 번만 렌더링해 페이지마다 재사용할 조각으로 나눕니다.
+
+    페이지마다 달라지는 것은 제목, 본문, 현재 페이지 링크의 active 클래스뿐이므로
+    링크마다 active가 들어갈 위치에서 네비게이션을 미리 잘라 둡니다.
+    레지스트리는 실행 중에 바뀌지 않으므로 프로세스당 한 번만 만듭니다.
+    """
+    template = _html_page_template(_TITLE_SLOT, _NAV_SLOT, _CONTENT_SLOT)
+    head, rest = template.split(_TITLE_SLOT)
+    after_title, rest = rest.split(_NAV_SLOT)
+    after_nav, tail = rest.split(_CONTENT_SLOT)
+    
+    navigation = get_navigation()
+    slots = {}
+    for page in PAGES:
+        link = f'href="{page}" class="docs-nav-link'
+        offset = navigation.index(link) + len(link)
+        slots[page] = (after_title + navigation[:offset], navigation[offset:] + after_nav)
+    return PageShell(head, slots, (after_title + navigation, after_nav), tail)
+
+
+def generate_html_page(title: str, content: str, current_page: str = "") -> str:
+    """HTML 페이지 생성 (미리 나눠 둔 틀에 제목, active 표시, 본문만 끼워 넣음)"""
+    shell = compile_page_shell()
+    slot = shell.slots.get(current_page)
+    if slot is None:
+        return "".join((shell.head, title, shell.inactive[0], shell.inactive[1], content, shell.tail))
+    return "".join((shell.head, title, slot[0], NAV_ACTIVE_MARKER, slot[1], content, shell.tail))
+
+
+# ============================================
+# SCSS 토큰 인덱스
+# ============================================
+# 빌드마다 rexbox/ 아래 SCSS 파일을 한 번씩만 읽고,
+# 변수 / map / mixin / selector 토큰을 한 번에 추출해 둡니다.
+# 모든 extract_* 함수와 페이지 생성 함수는 이 인덱스를 조회합니다.
+
+class ScssFile:
+    """한 SCSS 파일의 원문과 토큰 목록"""
+
+    def __init__(self, path: Path, content: str):
+        self.path = path
+        self.content = content
+        # (이름, 원시 값) - 파일에 나타난 순서 유지
+        self.variables = [m.group('name', 'value') for m in Patterns.SCSS_VARIABLE.finditer(content)]
+        # (키, 값)
+        self.map_entries = [m.group('key', 'value') for m in Patterns.SCSS_MAP_ENTRY.finditer(content)]
+        # (이름, 파라미터)
+        self.mixins = [(m.group('name'), m.group('params') or "") for m in Patterns.SCSS_MIXIN.finditer(content)]
+        # (클래스 이름, 규칙 선언 여부)
+        self.selectors = [(m.group('name'), m.group('block') is not None) for m in Patterns.SCSS_SELECTOR.finditer(content)]
+
+    def rule_selectors(self) -> List[str]:
+        """바로 뒤에 "{"가 오는 클래스 이름 목록"""
+        return [name for name, opens_block in self.selectors if opens_block]
+
+
+class ScssIndex:
+    """빌드 단위 SCSS 파일 인덱스 (파일당 한 번만 읽고 토큰화)
+
+    trace() 안에서는 조회한 파일 경로를 모두 기록합니다. 메모리에 남아 있는 원문이나
+    추출 결과를 재사용한 경우에도 그 결과를 만들 때 읽은 파일을 함께 기록하므로,
+    페이지마다 실제로 읽은 입력 파일 목록을 얻을 수 있습니다.
+    """
+
+    def __init__(self, root: Path = ROOT_DIR):
+        self.root = root
+        self._sources: Dict[Path, Optional[bytes]] = {}
+        self._stats: Dict[Path, Optional[Tuple[int, int, int]]] = {}
+        self._digests: Dict[Path, str] = {}
+        self._files: Dict[Path, Optional[ScssFile]] = {}
+        # 키 -> (추출 결과, 계산 중에 읽은 파일)
+        self._derived: Dict[tuple, Tuple[object, FrozenSet[Path]]] = {}
+        # 스레드별 trace() 기록 스택
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def trace(self):
+        """블록 안에서 조회한 파일 경로(resolve된 Path) 집합을 기록합니다. 중첩할 수 있습니다."""
+        reads: Set[Path] = set()
+        stack = self._trace_stack()
+        stack.append(reads)
+        try:
+            yield reads
+        finally:
+            stack.pop()
+
+    def _trace_stack(self) -> List[Set[Path]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _record_reads(self, paths) -> None:
+        for reads in self._trace_stack():
+            reads.update(paths)
+
+    def source(self, path: Path) -> Optional[bytes]:
+        """파일 원문(bytes)을 반환합니다. 파일이 없으면 None."""
+        key = Path(path).resolve()
+        # 없는 파일도 기록: 나중에 생기면 결과가 바뀜
+        self._record_reads((key,))
+        if key not in self._sources:
+            try:
+                with open(key, 'rb') as f:
+                    self._stats[key] = file_stat_key(os.fstat(f.fileno()))
+                    self._sources[key] = f.read()
+            except FileNotFoundError:
+                self._stats[key] = None
+                self._sources[key] = None
+        return self._sources[key]
+
+    def stale_paths(self) -> List[Path]:
+        """읽은 뒤에 디스크에서 바뀐 (또는 생기거나 지워진) 파일 목록 (데몬용)
+
+        (inode, mtime_ns, 크기)만 비교하므로 내용은 다시 읽지 않습니다.
+        """
+        stale = []
+        for key, stat_key in self._stats.items():
+            try:
+                current = file_stat_key(os.stat(key))
+            except FileNotFoundError:
+                current = None
+            if current != stat_key:
+                stale.append(key)
+        return stale
+
+    def digest(self, path: Path) -> str:
+        """파일 내용의 sha256 (없는 파일은 "missing")"""
+        key = Path(path).resolve()
+        # 메모된 digest를 재사용해도 조회 자체는 기록 (디스크 캐시 적중 시 원문을 읽지 않음)
+        self._record_reads((key,))
+        if key not in self._digests:
+            data = self.source(key)
+            self._digests[key] = hashlib.sha256(data).hexdigest() if data is not None else "missing"
+        return self._digests[key]
+
+    def file(self, path: Path) -> Optional[ScssFile]:
+        """토큰화된 파일을 반환합니다. 파일이 없으면 None."""
+        key = Path(path).resolve()
+        self._record_reads((key,))
+        if key not in self._files:
+            data = self.source(key)
+            self._files[key] = ScssFile(key, data.decode('utf-8')) if data is not None else None
+        return self._files[key]
+
+    def invalidate(self, paths) -> None:
+        """변경된 파일만 다시 읽도록 해당 파일의 원문/토큰을 버립니다.
+
+        추출 결과는 여러 파일에 걸쳐 있을 수 있으므로 모두 비우고,
+        다음 조회 때 메모리에 남아 있는 토큰(또는 디스크 캐시)에서 다시 계산합니다.
+        디렉토리 경로(삭제/이름 변경된 디렉토리 포함)를 주면 그 아래 파일을 모두 버립니다.
+        """
+        changed = {Path(path).resolve() for path in paths}
+        for key in list(self._sources.keys() | self._files.keys()):
+            if is_changed_path(key, changed):
+                self._sources.pop(key, None)
+                self._stats.pop(key, None)
+                self._digests.pop(key, None)
+                self._files.pop(key, None)
+        self._derived.clear()
+
+    def derived(self, key: tuple, compute):
+        """같은 빌드 안에서 추출 결과를 재사용합니다."""
+        if key not in self._derived:
+            with self.trace() as reads:
+                value = compute()
+            self._derived[key] = (value, frozenset(reads))
+        value, reads = self._derived[key]
+        self._record_reads(reads)
+        return value
+
+
+def file_stat_key(st: os.stat_result) -> Tuple[int, int, int]:
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def is_changed_path(path: Path, changed) -> bool:
+    """path 자체나 그 상위 디렉토리가 changed(resolve된 경로 집합)에 있으면 True"""
+    return path in changed or any(parent in changed for parent in path.parents)
+
+
+_scss_index: Optional[ScssIndex] = None
+
+
+def get_scss_index() -> ScssIndex:
+    """현재 빌드의 SCSS 인덱스"""
+    global _scss_index
+    if _scss_index is None:
+        _scss_index = ScssIndex()
+    return _scss_index
+
+
+def reset_scss_index() -> ScssIndex:
+    """새 빌드를 위해 인덱스를 비웁니다."""
+    global _scss_index
+    _scss_index = ScssIndex()
+    return _scss_index
+
+
+# ============================================
+# 빌드 프로파일링 (--profile)
+# ============================================
+# 추출 함수, 페이지 생성 함수, 파일 쓰기마다 wall/CPU 시간을 기록합니다.
+
+class BuildProfiler:
+    """단계별 wall/CPU 시간 기록기"""
+
+    KIND_LABELS = {"extract": "추출", "page": "페이지 생성", "write": "파일 쓰기"}
+
+    def __init__(self):
+        # (종류, 이름, wall 초, CPU 초)
+        self.records: List[Tuple[str, str, float, float]] = []
+
+    @contextlib.contextmanager
+    def stage(self, kind: str, name: str):
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.records.append((kind, name,
+                                 time.perf_counter() - start_wall,
+                                 time.process_time() - start_cpu))
+
+    def summary(self) -> List[dict]:
+        """(종류, 이름)별로 호출 횟수와 합계를 모읍니다. 기록 순서를 유지합니다."""
+        totals: Dict[Tuple[str, str], dict] = {}
+        for kind, name, wall, cpu in self.records:
+            entry = totals.setdefault((kind, name), {"kind": kind, "name": name, "calls": 0, "wall": 0.0, "cpu": 0.0})
+            entry["calls"] += 1
+            entry["wall"] += wall
+            entry["cpu"] += cpu
+        return list(totals.values())
+
+    def phase_totals(self) -> Dict[str, float]:
+        """파싱(추출)/렌더링/쓰기 wall 시간 합계(초)
+
+        추출은 페이지 생성 안에서 호출되므로 렌더링 시간에서는 추출 시간을 뺍니다.
+        """
+        totals = {"extract": 0.0, "page": 0.0, "write": 0.0}
+        for kind, _, wall, _ in self.records:
+            totals[kind] = totals.get(kind, 0.0) + wall
+        return {"parse": totals["extract"],
+                "render": max(totals["page"] - totals["extract"], 0.0),
+                "write": totals["write"]}
+
+    def format_table(self) -> str:
+        lines = [f"  {'단계':<12} {'이름':<32} {'호출':>5} {'wall(ms)':>10} {'cpu(ms)':>10}"]
+        lines.append("  " + "-" * 73)
+        for entry in self.summary():
+            label = self.KIND_LABELS.get(entry["kind"], entry["kind"])
+            lines.append(f"  {label:<12} {entry['name']:<32} {entry['calls']:>5} "
+                         f"{entry['wall'] * 1000:>10.2f} {entry['cpu'] * 1000:>10.2f}")
+        return "\n".join(lines)
+
+    def save_json(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"stages": self.summary(), "phases": self.phase_totals()}, indent=2, ensure_ascii=False) + "\n",
+                        encoding="utf-8")
+
+
+_profiler: Optional[BuildProfiler] = None
+
+
+def profile_stage(kind: str, name: str):
+    """프로파일링 중이면 단계 시간을 기록하는 context manager, 아니면 아무 일도 하지 않습니다."""
+    if _profiler is None:
+        return contextlib.nullcontext()
+    return _profiler.stage(kind, name)
+
+
+# ============================================
+# 추출 결과 디스크 캐시
+# ============================================
+# extract_* 결과를 입력 파일 내용 해시로 키를 만들어 docs/.cache/ 에 저장합니다.
+# 입력이 바뀌지 않은 warm 빌드는 SCSS 토큰화를 건너뜁니다.
+
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+class ExtractCache:
+    """내용 해시 기반 extract_* 결과 캐시 (크기 제한, LRU 방식 정리)"""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR / "extract", max_bytes: int = CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, name: str, args_repr: str, input_digests: List[str]) -> str:
+        h = hashlib.sha256()
+        h.update(generator_code_digest().encode())
+        h.update(name.encode())
+        h.update(args_repr.encode('utf-8'))
+        for digest in input_digests:
+            h.update(digest.encode())
+        return h.hexdigest()
+
+    def get(self, key: str):
+        """캐시된 값과 적중 여부를 반환합니다."""
+        path = self.cache_dir / f"{key}.pickle"
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            self.misses += 1
+            return None, False
+        # LRU 정리를 위해 사용 시각 갱신
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value, True
+
+    def put(self, key: str, value) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_dir / f"{key}.pickle")
+        except OSError:
+            pass
+
+    def prune(self) -> None:
+        """전체 크기가 max_bytes를 넘으면 오래 사용되지 않은 항목부터 지웁니다."""
+        try:
+            entries = [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith('.pickle')]
+        except FileNotFoundError:
+            return
+        stats = []
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            stats.append((st.st_mtime_ns, st.st_size, entry.path))
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in sorted(stats):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+
+
+_extract_cache: Optional[ExtractCache] = None
+_extract_cache_enabled = True
+_generator_code_digest: Optional[str] = None
+
+
+def generator_code_digest() -> str:
+    """생성기 코드가 바뀌면 캐시가 무효화되도록 스크립트 자체의 해시를 사용합니다."""
+    global _generator_code_digest
+    if _generator_code_digest is None:
+        _generator_code_digest = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    return _generator_code_digest
+
+
+def configure_extract_cache(enabled: bool = True, cache_dir: Optional[Path] = None) -> None:
+    """디스크 캐시 사용 여부를 설정합니다 (--no-cache).
+
+    cache_dir를 주면 추출 캐시는 그 디렉토리에, HTML 조각 캐시는 같은 위치의 fragments/에 둡니다.
+    """
+    global _extract_cache, _extract_cache_enabled, _fragment_cache, _fragment_cache_dir
+    _extract_cache_enabled = enabled
+    _extract_cache = ExtractCache(cache_dir) if cache_dir is not None else None
+    _fragment_cache = None
+    _fragment_cache_dir = cache_dir.parent / "fragments" if cache_dir is not None else CACHE_DIR / "fragments"
+
+
+def get_extract_cache() -> Optional[ExtractCache]:
+    global _extract_cache
+    if not _extract_cache_enabled:
+        return None
+    if _extract_cache is None:
+        _extract_cache = ExtractCache()
+    return _extract_cache
+
+
+def prune_caches() -> None:
+    """디스크 캐시를 크기 제한 안으로 정리합니다.
+
+    상주 프로세스(watcher, 데몬, --serve)는 재생성마다 호출해 캐시가 끝없이 커지지 않게 합니다.
+    """
+    cache = get_extract_cache()
+    if cache is not None:
+        cache.prune()
+    fragments = get_fragment_cache()
+    if fragments is not None and fragments.disk is not None:
+        fragments.disk.prune()
+
+
+def cached_extractor(*input_files: Path):
+    """extract_* 결과를 빌드 내 메모리와 디스크 캐시에 저장하는 데코레이터
+
+    캐시 키에는 선언된 입력 파일, Path 인자로 받은 파일의 내용 해시,
+    나머지 인자의 repr, 생성기 코드 해시가 들어갑니다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            index = get_scss_index()
+            args_repr = repr(args)
+
+            def compute():
+                files = list(input_files) + [arg for arg in args if isinstance(arg, Path)]
+                cache = get_extract_cache()
+                if cache is None:
+                    return func(*args)
+                key = cache.key(func.__name__, args_repr, [index.digest(path) for path in files])
+                value, hit = cache.get(key)
+                if hit:
+                    return value
+                value = func(*args)
+                cache.put(key, value)
+                return value
+
+            with profile_stage("extract", func.__name__):
+                return index.derived((func.__name__, args_repr), compute)
+
+        return wrapper
+
+    return decorator
+
+
+# ============================================
+# HTML 조각 캐시
+# ============================================
+# 페이지 안에서 데이터에 따라 달라지는 구역(예: 팔레트 그룹 하나)을 입력 데이터의 digest로 캐시합니다.
+# 메모리 계층은 상주 프로세스(watcher, 데몬, --serve)에서 빌드 사이에 유지되고,
+# 디스크 계층(docs/.cache/fragments/)은 한 번씩 실행하는 CLI 빌드 사이에 재사용됩니다.
+# 입력이 바뀐 구역만 다시 렌더링합니다.
+
+FRAGMENT_CACHE_MAX_CHARS = 4 * 1024 * 1024
+
+
+class FragmentCache:
+    """입력 digest -> 렌더링된 HTML 조각 (메모리 LRU + 디스크, 각각 크기 제한)
+
+    같은 페이지의 조각은 매번 같은 순서로 조회되므로, 한 페이지의 조각이 메모리 예산보다
+    크면 단순 LRU는 재사용 전에 모두 밀어내게 됩니다. 이를 막기 위해 현재 렌더링
+    (next_generation() 이후)에서 쓴 조각은 밀어내지 않고, 자리가 없으면 새 조각을
+    메모리에 넣지 않습니다 (디스크 계층에는 그대로 저장).
+    """
+
+    def __init__(self, max_chars: int = FRAGMENT_CACHE_MAX_CHARS, disk: Optional[ExtractCache] = None):
+        self.max_chars = max_chars
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+        # 키 -> (HTML, 마지막으로 쓴 렌더링 세대)
+        self._entries: "collections.OrderedDict[str, Tuple[str, int]]" = collections.OrderedDict()
+        self._size = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def next_generation(self) -> None:
+        """새 페이지 렌더링을 시작합니다."""
+        with self._lock:
+            self._generation += 1
+
+    @staticmethod
+    def key(name: str, inputs) -> str:
+        h = hashlib.sha256()
+        h.update(generator_code_digest().encode())
+        h.update(name.encode())
+        h.update(repr(inputs).encode('utf-8'))
+        return h.hexdigest()
+
+    def get_or_render(self, name: str, inputs, render: Callable[[], str]) -> str:
+        key = self.key(name, inputs)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], self._generation)
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        html, hit = self.disk.get(key) if self.disk is not None else (None, False)
+        if not hit:
+            self.misses += 1
+            html = render()
+            if self.disk is not None:
+                self.disk.put(key, html)
+        self._admit(key, html)
+        return html
+
+    def _admit(self, key: str, html: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                return
+            # 현재 렌더링에서 쓰지 않은 조각만 오래된 순서로 제거
+            while self._size + len(html) > self.max_chars and self._entries:
+                oldest_key, (oldest, generation) = next(iter(self._entries.items()))
+                if generation == self._generation:
+                    break
+                del self._entries[oldest_key]
+                self._size -= len(oldest)
+            if self._size + len(html) <= self.max_chars:
+                self._entries[key] = (html, self._generation)
+                self._size += len(html)
+
+
+_fragment_cache: Optional[FragmentCache] = None
+_fragment_cache_dir = CACHE_DIR / "fragments"
+
+
+def get_fragment_cache() -> Optional[FragmentCache]:
+    """HTML 조각 캐시 (--no-cache에서는 None)"""
+    global _fragment_cache
+    if not _extract_cache_enabled:
+        return None
+    if _fragment_cache is None:
+        _fragment_cache = FragmentCache(disk=ExtractCache(_fragment_cache_dir))
+    return _fragment_cache
+
+
+def cached_fragment(name: str, inputs, render: Callable[[], str]) -> str:
+    """render()의 결과를 name과 inputs(렌더링에 쓰는 데이터 전부)의 digest로 캐시합니다."""
+    cache = get_fragment_cache()
+    if cache is None:
+        return render()
+    return cache.get_or_render(name, inputs, render)
+
+
 # ============================================
 # Colors 페이지 (기존 코드 활용)
 # ============================================
 
+@cached_extractor()
 def extract_color_variables(scss_file: Path) -> Dict[str, str]:
     """SCSS 파일에서 색상 변수를 추출합니다."""
     colors = {}
-    if not scss_file.exists():
+    scss = get_scss_index().file(scss_file)
+    if scss is None:
         return colors
-    
-    with open(scss_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    pattern = r'\$([a-z0-9-]+):\s*(#[0-9a-fA-F]{3,6}|#[0-9a-fA-F]{8})\s*;'
-    matches = re.finditer(pattern, content)
-    
-    for match in matches:
-        var_name = match.group(1)
-        color_value = match.group(2).upper()
-        colors[var_name] = color_value
-    
+
+    for var_name, value in scss.variables:
+        match = Patterns.HEX_COLOR_VALUE.fullmatch(value)
+        if match:
+            colors[var_name] = match.group('color').upper()
+
     return colors
 
 
+@cached_extractor()
 def extract_theme_mappings(theme_file: Path, color_vars: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
     """Theme 파일에서 semantic color 매핑을 추출합니다."""
     mappings = {}
-    if not theme_file.exists():
+    scss = get_scss_index().file(theme_file)
+    if scss is None:
         return mappings
-    
-    with open(theme_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
+
     # !default가 있는 경우와 없는 경우 모두 처리
-    pattern = r'\$([a-z0-9-]+):\s*\$([a-z0-9-]+)\s*(?:!default)?\s*;'
-    matches = re.finditer(pattern, content)
-    
-    for match in matches:
-        semantic_name = match.group(1)
-        base_color_var = match.group(2)
+    for semantic_name, value in scss.variables:
+        match = Patterns.THEME_MAPPING_VALUE.fullmatch(value)
+        if not match:
+            continue
+        base_color_var = match.group('base')
         if base_color_var in color_vars:
             mappings[semantic_name] = (base_color_var, color_vars[base_color_var])
-    
+
     return mappings
 
 
 def sort_color_by_brightness(color_list: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
     """색상을 밝은 순서대로 정렬합니다."""
+    step_search = Patterns.STEP_SUFFIX.search
+    
     def get_sort_key(item):
-        var_name = item[0]
-        match = re.search(r'-(\d+)$', var_name)
+        match = step_search(item[0])
         if match:
-            num = int(match.group(1))
-            return (1, num)
-        else:
-            return (0, 0)
+            return (1, int(match.group('step')))
+        return (0, 0)
     return sorted(color_list, key=get_sort_key)
 
 
-def get_category_order_from_file(color_vars: Dict[str, str]) -> Dict[str, int]:
+@cached_extractor(VARIABLES_COLORS_FILE)
+def get_category_order_from_file() -> Dict[str, int]:
     """variables/_colors.scss 파일에서 카테고리가 나타나는 순서를 추적합니다."""
     category_order = {}
     order = 0
     seen_categories = set()
     
-    with open(VARIABLES_COLORS_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    pattern = r'\$([a-z0-9-]+):\s*#[0-9a-fA-F]{3,8}\s*;'
-    matches = re.finditer(pattern, content)
+    scss = get_scss_index().file(VARIABLES_COLORS_FILE)
+    variables = scss.variables if scss is not None else []
     
-    for match in matches:
-        var_name = match.group(1)
+    for var_name, value in variables:
+        if not Patterns.CATEGORY_COLOR_VALUE.fullmatch(value):
+            continue
         if var_name in ['white', 'white-real', 'black', 'black-real']:
             category = 'Global'
         else:
@@ -266,7 +853,7 @@ def generate_colors_page() -> str:
             link_colors.append(item)
     
     # HTML 생성
-    content = """
+    content = HtmlBuilder("""
         <h1>Theme</h1>
         <p class="subtitle">RexBox의 semantic 색상 테마. 프로젝트별 config에서 추가 설정하여 오버라이드할 수 있는 항목입니다.</p>
         
@@ -301,22 +888,22 @@ def generate_colors_page() -> str:
         <!-- Semantic Colors (Theme) -->
         <div class="section">
             <h2 class="section-title">Semantic Colors (Theme)</h2>
-    """
+    """)
     
     # Brand Colors (최상단으로 이동)
     if brand_colors:
-        content += """
+        content.write("""
             <div class="category-group">
                 <div class="category-title">Brand Colors</div>
                 <p style="margin-bottom: 16px; color: #64748b; font-size: 14px;">프로젝트의 브랜드 색상입니다. 100~900 숫자를 붙여 Step value로 사용 가능합니다.</p>
                 <div class="semantic-colors">
-        """
+        """)
         brand_colors_sorted = sorted(brand_colors, key=lambda x: (0 if x[0] == 'primary' else 1 if x[0] == 'secondary' else 2, x[0]))
         for name, color, base_var in brand_colors_sorted:
             text_color = "#1e293b" if color.upper() not in ['#000000', '#000'] else "#ffffff"
             border_style = 'border: 1px solid #e2e8f0;' if color.upper() in ['#FCFCFC', '#FFFFFF'] else ''
             steps_info = "100, 200, 300, 400, 500, 600, 700, 800, 900"
-            content += f"""
+            content.write(f"""
                     <div class="semantic-item bg-example" style="background: {color}; {border_style}">
                         <div class="semantic-info">
                             <div class="semantic-name">${name}</div>
@@ -326,24 +913,24 @@ def generate_colors_page() -> str:
                             <div style="margin-top: 4px; font-size: 11px; color: #94a3b8;">예: ${name}-500 (기본값), ${name}-200 (밝은 색), ${name}-800 (어두운 색)</div>
                         </div>
                     </div>
-            """
-        content += """
+            """)
+        content.write("""
                 </div>
             </div>
-        """
+        """)
     
     # Neutral Color System (Gray System)
     if neutral_colors or 'slate-500' in color_vars:
-        content += """
+        content.write("""
             <div class="category-group">
                 <div class="category-title">Neutral Color System</div>
                 <p style="margin-bottom: 16px; color: #64748b; font-size: 14px;">무채색(neutral) 용도로 사용되는 기본 색상 시스템입니다. Slate를 기본 무채색으로 사용하며, 50~950 숫자를 붙여 Step value로 사용 가능합니다.</p>
                 <div class="semantic-colors">
-        """
+        """)
         slate_color = color_vars.get('slate-500', '#64748b')
         text_color = "#1e293b"
         steps_info = "50, 100, 200, 300, 400, 500, 600, 700, 800, 900, 950"
-        content += f"""
+        content.write(f"""
                     <div class="semantic-item bg-example" style="background: {slate_color}; border: 1px solid #e2e8f0;">
                         <div class="semantic-info">
                             <div class="semantic-name">$slate</div>
@@ -353,23 +940,23 @@ def generate_colors_page() -> str:
                             <div style="margin-top: 4px; font-size: 11px; color: #94a3b8;">예: $slate-500 (기본값), $slate-200 (밝은 색), $slate-800 (어두운 색)</div>
                         </div>
                     </div>
-        """
-        content += """
+        """)
+        content.write("""
                 </div>
             </div>
-        """
+        """)
     
     # Background Colors
     if bg_colors:
-        content += """
+        content.write("""
             <div class="category-group">
                 <div class="category-title">Background Colors</div>
                 <div class="semantic-colors">
-        """
+        """)
         for name, color, base_var in sort_color_by_brightness(bg_colors):
             text_color = "#1e293b" if not name.startswith('bg-dark') else "#ffffff"
             border_style = 'border: 1px solid #e2e8f0;' if color.upper() in ['#FCFCFC', '#FFFFFF'] else ''
-            content += f"""
+            content.write(f"""
                     <div class="semantic-item bg-example" style="background: {color}; {border_style}">
                         <div class="semantic-info">
                             <div class="semantic-name">${name}</div>
@@ -377,24 +964,24 @@ def generate_colors_page() -> str:
                             <div class="example-text" style="margin-top: 8px; color: {text_color};">background-color: ${name};</div>
                         </div>
                     </div>
-            """
+            """)
         
-        content += """
+        content.write("""
                 </div>
             </div>
-        """
+        """)
     
     # Text Colors
     if text_colors:
-        content += """
+        content.write("""
             <div class="category-group">
                 <div class="category-title">Text Colors</div>
                 <div class="semantic-colors">
-        """
+        """)
         for name, color, base_var in sort_color_by_brightness(text_colors):
             bg_color = "#111827" if name == 'text-inverse' else "#ffffff"
             border_style = 'border: 1px solid #e2e8f0;' if bg_color == '#ffffff' else ''
-            content += f"""
+            content.write(f"""
                     <div class="semantic-item text-example" style="background: {bg_color}; {border_style}">
                         <div class="semantic-info">
                             <div class="semantic-name">${name}</div>
@@ -402,22 +989,22 @@ def generate_colors_page() -> str:
                             <div class="example-text" style="margin-top: 8px; color: {color};">color: ${name};</div>
                         </div>
                     </div>
-            """
+            """)
         
-        content += """
+        content.write("""
                 </div>
             </div>
-        """
+        """)
     
     # Border Colors
     if border_colors:
-        content += """
+        content.write("""
             <div class="category-group">
                 <div class="category-title">Border Colors</div>
                 <div class="semantic-colors">
-        """
+        """)
         for name, color, base_var in sort_color_by_brightness(border_colors):
-            content += f"""
+            content.write(f"""
                     <div class="semantic-item border-example" style="background: #ffffff; border: 2px solid {color};">
                         <div class="semantic-info">
                             <div class="semantic-name">${name}</div>
@@ -425,22 +1012,22 @@ def generate_colors_page() -> str:
                             <div class="example-text" style="margin-top: 8px; color: #1e293b;">border: 1px solid ${name};</div>
                         </div>
                     </div>
-            """
+            """)
         
-        content += """
+        content.write("""
                 </div>
             </div>
-        """
+        """)
     
     # State Colors
     if state_colors:
-        content += """
+        content.write("""
             <div class="category-group">
                 <div class="category-title">State Colors</div>
                 <div class="semantic-colors">
-        """
+        """)
         for name, color, base_var in sort_color_by_brightness(state_colors):
-            content += f"""
+            content.write(f"""
                     <div class="semantic-item">
                         <div class="semantic-swatch" style="background: {color};"></div>
                         <div class="semantic-info">
@@ -448,21 +1035,21 @@ def generate_colors_page() -> str:
                             <div class="semantic-value">{color}</div>
                         </div>
                     </div>
-            """
-        content += """
+            """)
+        content.write("""
                 </div>
             </div>
-        """
+        """)
     
     # Stock Colors
     if stock_colors:
-        content += """
+        content.write("""
             <div class="category-group">
                 <div class="category-title">Stock/Finance State Colors</div>
                 <div class="semantic-colors">
-        """
+        """)
         for name, color, base_var in sort_color_by_brightness(stock_colors):
-            content += f"""
+            content.write(f"""
                     <div class="semantic-item">
                         <div class="semantic-swatch" style="background: {color};"></div>
                         <div class="semantic-info">
@@ -470,21 +1057,21 @@ def generate_colors_page() -> str:
                             <div class="semantic-value">{color}</div>
                         </div>
                     </div>
-            """
-        content += """
+            """)
+        content.write("""
                 </div>
             </div>
-        """
+        """)
     
     # Link Colors
     if link_colors:
-        content += """
+        content.write("""
             <div class="category-group">
                 <div class="category-title">Link Colors</div>
                 <div class="semantic-colors">
-        """
+        """)
         for name, color, base_var in sort_color_by_brightness(link_colors):
-            content += f"""
+            content.write(f"""
                     <div class="semantic-item text-example" style="background: #ffffff; border: 1px solid #e2e8f0;">
                         <div class="semantic-info">
                             <div class="semantic-name">${name}</div>
@@ -492,17 +1079,17 @@ def generate_colors_page() -> str:
                             <div class="example-text" style="margin-top: 8px; color: {color}; text-decoration: underline;">color: ${name};</div>
                         </div>
                     </div>
-            """
-        content += """
+            """)
+        content.write("""
                 </div>
             </div>
-        """
+        """)
     
-    content += """
+    content.write("""
         </div>
-    """
+    """)
     
-    content += """
+    content.write("""
         <div class="section">
             <h2 class="section-title">Utility Classes</h2>
             <p style="margin-bottom: 16px; color: #64748b;">semantic 색상과 연계된 유틸리티 클래스를 사용하면 SCSS 수정 없이도 신속하게 색상을 지정할 수 있습니다.</p>
@@ -606,9 +1193,35 @@ def generate_colors_page() -> str:
                 </div>
             </div>
         </div>
-        """
+        """)
     
-    return content
+    return content.getvalue()
+
+
+def render_palette_group(category: str, color_list: List[Tuple[str, str]]) -> str:
+    """Color Palettes 페이지의 팔레트 그룹 하나"""
+    group = HtmlBuilder(f"""
+            <div class="palette-group">
+                <div class="palette-title">{category}</div>
+                <div class="color-grid">
+        """)
+    sorted_color_list = sort_color_by_brightness(color_list)
+    for var_name, color_value in sorted_color_list:
+        border_style = 'border: 1px solid #e2e8f0;' if color_value.upper() in ['#FCFCFC', '#FFFFFF'] else ''
+        group.write(f"""
+                    <div class="color-item">
+                        <div class="color-swatch" style="background: {color_value}; {border_style}"></div>
+                        <div class="color-info">
+                            <div class="color-name">${var_name}</div>
+                            <div class="color-value">{color_value}</div>
+                        </div>
+                    </div>
+            """)
+    group.write("""
+                </div>
+            </div>
+        """)
+    return group.getvalue()
 
 
 def generate_color_palettes_page() -> str:
@@ -617,25 +1230,19 @@ def generate_color_palettes_page() -> str:
     color_vars = extract_color_variables(VARIABLES_COLORS_FILE)
     
     # 카테고리 순서 가져오기
-    category_order_map = get_category_order_from_file(color_vars)
+    category_order_map = get_category_order_from_file()
     
     # 색상 카테고리별로 분류
-    categories = {
-        'Global': [],
-        'Slate': [], 'Gray': [], 'Zinc': [], 'Neutral': [], 'Stone': [],
-        'Lime': [], 'Green': [], 'Emerald': [], 'Teal': [], 'Cyan': [],
-        'Sky': [], 'Blue': [], 'Indigo': [], 'Violet': [], 'Purple': [],
-        'Fuchsia': [], 'Pink': [], 'Rose': [], 'Red': [], 'Orange': [],
-        'Amber': [], 'Yellow': [],
-    }
+    categories = {name: [] for name in PALETTE_CATEGORY_NAMES}
+    category_by_prefix = {name.lower(): name for name in PALETTE_CATEGORY_NAMES}
+    category_prefix_match = Patterns.PALETTE_CATEGORY_PREFIX.match
     
-    # 색상 변수 분류
+    # 색상 변수 분류 (카테고리 접두사는 미리 컴파일된 하나의 정규식으로 판별)
     for var_name, color_value in sorted(color_vars.items()):
         category = None
-        for cat in categories.keys():
-            if var_name.startswith(cat.lower()):
-                category = cat
-                break
+        prefix_match = category_prefix_match(var_name)
+        if prefix_match:
+            category = category_by_prefix[prefix_match.group()]
         
         if not category:
             if var_name in ['white', 'white-soft', 'black', 'black-soft']:
@@ -653,14 +1260,14 @@ def generate_color_palettes_page() -> str:
             categories['Global'].append((var_name, color_value))
     
     # HTML 생성
-    content = """
+    content = HtmlBuilder("""
         <h1>Color Palettes</h1>
         <p class="subtitle">RexBox에서 사용 가능한 모든 원시 색상 팔레트입니다. 일반적으로는 Theme 색상을 사용하는 것을 권장합니다.</p>
         
         <div class="section">
             <h2 class="section-title">Color Palettes</h2>
             <p style="margin-bottom: 16px; color: #64748b;">원시 색상 변수는 프로젝트에서 직접 사용하거나 Theme 색상을 오버라이드할 때 사용할 수 있습니다.</p>
-    """
+    """)
     
     def get_category_sort_key(item):
         category, color_list = item
@@ -674,57 +1281,34 @@ def generate_color_palettes_page() -> str:
     for category, color_list in sorted_categories:
         if not color_list:
             continue
-        
-        content += f"""
-            <div class="palette-group">
-                <div class="palette-title">{category}</div>
-                <div class="color-grid">
-        """
-        sorted_color_list = sort_color_by_brightness(color_list)
-        for var_name, color_value in sorted_color_list:
-            border_style = 'border: 1px solid #e2e8f0;' if color_value.upper() in ['#FCFCFC', '#FFFFFF'] else ''
-            content += f"""
-                    <div class="color-item">
-                        <div class="color-swatch" style="background: {color_value}; {border_style}"></div>
-                        <div class="color-info">
-                            <div class="color-name">${var_name}</div>
-                            <div class="color-value">{color_value}</div>
-                        </div>
-                    </div>
-            """
-        content += """
-                </div>
-            </div>
-        """
+        # 팔레트 그룹은 해당 카테고리의 색상이 바뀐 경우에만 다시 렌더링
+        content.write(cached_fragment("palette-group", (category, color_list),
+                                      lambda: render_palette_group(category, color_list)))
     
-    content += """
+    content.write("""
         </div>
-    """
+    """)
 
-    return content
+    return content.getvalue()
 
 
 # ============================================
 # Breakpoints 페이지
 # ============================================
 
+@cached_extractor(BREAKPOINTS_FILE)
 def extract_breakpoints() -> Dict[str, str]:
     """Breakpoints 파일에서 breakpoint 값을 추출합니다."""
     breakpoints = {}
-    if not BREAKPOINTS_FILE.exists():
+    scss = get_scss_index().file(BREAKPOINTS_FILE)
+    if scss is None:
         return breakpoints
     
-    with open(BREAKPOINTS_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # Map 정의 찾기
-    pattern = r'"([^"]+)":\s*(\d+px)'
-    matches = re.finditer(pattern, content)
-    
-    for match in matches:
-        key = match.group(1)
-        value = match.group(2)
-        breakpoints[key] = value
+    for key, value in scss.map_entries:
+        match = Patterns.PX_VALUE.match(value)
+        if match:
+            breakpoints[key] = match.group(0)
     
     return breakpoints
 
@@ -733,7 +1317,7 @@ def generate_breakpoints_page() -> str:
     """Breakpoints 페이지 생성"""
     breakpoints = extract_breakpoints()
     
-    content = """
+    content = HtmlBuilder("""
         <h1>Breakpoints</h1>
         <p class="subtitle">반응형 디자인을 위한 breakpoint 값들</p>
         
@@ -749,7 +1333,7 @@ def generate_breakpoints_page() -> str:
                     </tr>
                 </thead>
                 <tbody>
-    """
+    """)
     
     # Breakpoint 용도 설명
     descriptions = {
@@ -767,16 +1351,16 @@ def generate_breakpoints_page() -> str:
     
     for key, value in sorted_bps:
         desc = descriptions.get(key, "")
-        content += f"""
+        content.write(f"""
                     <tr>
                         <td><code class="code">{key}</code></td>
                         <td><code class="code">{value}</code></td>
                         <td>{desc}</td>
                         <td><code class="code">@include up("{key}")</code></td>
                     </tr>
-        """
+        """)
     
-    content += """
+    content.write("""
                 </tbody>
             </table>
         </div>
@@ -850,40 +1434,38 @@ def generate_breakpoints_page() -> str:
                 <li><code class="code">$desktop-xl</code> = <code class="code">$bp["xxl"]</code> (1400px)</li>
             </ul>
         </div>
-    """
+    """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
 # Typography 페이지
 # ============================================
 
+@cached_extractor(TYPOGRAPHY_FILE)
 def extract_typography() -> Dict[str, Dict[str, str]]:
     """Typography 파일에서 font size와 weight 값을 추출합니다."""
     typo = {"sizes": {}, "weights": {}}
-    if not TYPOGRAPHY_FILE.exists():
+    scss = get_scss_index().file(TYPOGRAPHY_FILE)
+    if scss is None:
         return typo
     
-    with open(TYPOGRAPHY_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Font sizes 추출
-    size_pattern = r'\$font-size-([a-z0-9-]+):\s*rem\((\d+)\);'
-    size_matches = re.finditer(size_pattern, content)
-    for match in size_matches:
-        key = match.group(1)
-        px_value = match.group(2)
-        rem_value = f"{int(px_value) / 16}rem"
-        typo["sizes"][key] = {"px": px_value, "rem": rem_value}
-    
-    # Font weights 추출
-    weight_pattern = r'\$font-weight-([a-z]+):\s*(\d+);'
-    weight_matches = re.finditer(weight_pattern, content)
-    for match in weight_matches:
-        key = match.group(1)
-        value = match.group(2)
-        typo["weights"][key] = value
+    for var_name, value in scss.variables:
+        # Font sizes 추출
+        size_match = Patterns.FONT_SIZE_NAME.fullmatch(var_name)
+        rem_match = Patterns.REM_CALL_VALUE.fullmatch(value)
+        if size_match and rem_match:
+            key = size_match.group('key')
+            px_value = rem_match.group('px')
+            rem_value = f"{int(px_value) / 16}rem"
+            typo["sizes"][key] = {"px": px_value, "rem": rem_value}
+            continue
+        
+        # Font weights 추출
+        weight_match = Patterns.FONT_WEIGHT_NAME.fullmatch(var_name)
+        if weight_match and Patterns.DIGITS.fullmatch(value):
+            typo["weights"][weight_match.group('key')] = value
     
     return typo
 
@@ -892,7 +1474,7 @@ def generate_typography_page() -> str:
     """Typography 페이지 생성"""
     typo = extract_typography()
     
-    content = """
+    content = HtmlBuilder("""
         <h1>Typography</h1>
         <p class="subtitle">폰트 크기 및 굵기 설정값</p>
         
@@ -936,7 +1518,7 @@ def generate_typography_page() -> str:
                     </tr>
                 </thead>
                 <tbody>
-    """
+    """)
     
     # Font sizes 정렬 (3xs부터 9xl까지)
     size_order = ["3xs", "2xs", "xs", "sm", "base", "lg", "xl", "2xl", "3xl", "4xl", "5xl", "6xl", "7xl", "8xl", "9xl"]
@@ -944,7 +1526,7 @@ def generate_typography_page() -> str:
         if size_key in typo["sizes"]:
             size_info = typo["sizes"][size_key]
             utility_class = f"fs-{size_key}"
-            content += f"""
+            content.write(f"""
                     <tr>
                         <td><code class="code">$font-size-{size_key}</code></td>
                         <td><code class="code">{size_info["rem"]}</code></td>
@@ -952,9 +1534,9 @@ def generate_typography_page() -> str:
                         <td><code class="code">.{utility_class}</code></td>
                         <td style="font-size: {size_info["rem"]};">예시 텍스트</td>
                     </tr>
-            """
+            """)
     
-    content += """
+    content.write("""
                 </tbody>
             </table>
         </div>
@@ -971,7 +1553,7 @@ def generate_typography_page() -> str:
                     </tr>
                 </thead>
                 <tbody>
-    """
+    """)
     
     weight_order = ["light", "normal", "medium", "semibold", "bold", "black"]
     for weight_key in weight_order:
@@ -979,44 +1561,39 @@ def generate_typography_page() -> str:
             value = typo["weights"][weight_key]
             font_weight = int(value)
             utility_class = f"fw-{weight_key}"
-            content += f"""
+            content.write(f"""
                     <tr>
                         <td><code class="code">$font-weight-{weight_key}</code></td>
                         <td><code class="code">{value}</code></td>
                         <td><code class="code">.{utility_class}</code></td>
                         <td style="font-weight: {font_weight};">예시 텍스트</td>
                     </tr>
-            """
+            """)
     
-    content += """
+    content.write("""
                 </tbody>
             </table>
         </div>
-    """
+    """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
 # Spacing 페이지
 # ============================================
 
+@cached_extractor(SPACING_FILE)
 def extract_spacing() -> Dict[str, str]:
     """Spacing 파일에서 spacing 값을 추출합니다."""
     spacing = {}
-    if not SPACING_FILE.exists():
+    scss = get_scss_index().file(SPACING_FILE)
+    if scss is None:
         return spacing
     
-    with open(SPACING_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    pattern = r'\$([a-z]+):\s*(\d+px);'
-    matches = re.finditer(pattern, content)
-    
-    for match in matches:
-        key = match.group(1)
-        value = match.group(2)
-        spacing[key] = value
+    for key, value in scss.variables:
+        if Patterns.SPACING_NAME.fullmatch(key) and Patterns.PX_VALUE.fullmatch(value):
+            spacing[key] = value
     
     return spacing
 
@@ -1025,14 +1602,14 @@ def generate_spacing_page() -> str:
     """Spacing 페이지 생성"""
     spacing = extract_spacing()
     
-    content = """
+    content = HtmlBuilder("""
         <h1>Spacing</h1>
         <p class="subtitle">간격 관련 변수 및 Utility Classes</p>
         <p style="margin-bottom: 24px; color: #64748b;">RexBox의 spacing 유틸리티는 Bootstrap의 spacing helper를 참고했습니다. <code class="code">.m-*</code>, <code class="code">.p-*</code>, <code class="code">.gap-*</code> 형태로 제공됩니다.</p>
-    """
+    """)
     
     if spacing:
-        content += """
+        content.write("""
         <div class="section">
             <h2 class="section-title">Spacing Variables</h2>
             <table>
@@ -1044,31 +1621,31 @@ def generate_spacing_page() -> str:
                     </tr>
                 </thead>
                 <tbody>
-        """
+        """)
         
         for key, value in spacing.items():
             desc = "기본 간격 단위 (margin, padding 기본값)" if key == "spacer" else ""
-            content += f"""
+            content.write(f"""
                     <tr>
                         <td><code class=\"code\">${key}</code></td>
                         <td><code class=\"code\">{value}</code></td>
                         <td>{desc}</td>
                     </tr>
-        """
+        """)
         
-        content += """
+        content.write("""
                 </tbody>
             </table>
         </div>
-        """
+        """)
     
-    content += """
+    content.write("""
         <div class="section">
             <h2 class="section-title">Spacing Utility Classes</h2>
             <p>다음 utility classes를 사용하여 간격을 빠르게 적용할 수 있습니다:</p>
-    """
+    """)
     
-    content += """
+    content.write("""
             <h3 style="font-size: 16px; font-weight: 600; margin-top: 24px; margin-bottom: 12px; color: #1e293b;">Margin Utilities</h3>
             <table>
                 <thead>
@@ -1147,13 +1724,13 @@ def generate_spacing_page() -> str:
 // → .u-m-2, .u-p-2 등으로 생성됨</code></pre>
             </div>
         </div>
-    """
+    """)
     
-    content += """
+    content.write("""
         <p style="margin-top: 16px; color: #64748b;">Spacing 유틸리티는 모두 <code class="code">!important</code>를 사용하므로, 특정 컴포넌트에서 강제 적용할 때 유용합니다.</p>
-    """
+    """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -1164,13 +1741,13 @@ WIDTH_FILE = ROOT_DIR / "utilities" / "_width.scss"
 
 def generate_width_page() -> str:
     """Width Utilities 페이지 생성"""
-    content = """
+    content = HtmlBuilder("""
         <h1>Width Utilities</h1>
         <p class="subtitle">공통 백분율 기반 width 헬퍼 클래스</p>
         <p style="margin-bottom: 24px; color: #64748b;"><code class="code">.w-*</code> 접두사는 요소에 고정된 너비를 적용할 때 유용합니다. Tailwind의 width 유틸리티에서 자주 쓰는 분수를 기준으로 선택했습니다.</p>
-    """
+    """)
 
-    content += """
+    content.write("""
         <div class="section">
             <h2 class="section-title">클래스 요약</h2>
             <table>
@@ -1194,9 +1771,9 @@ def generate_width_page() -> str:
                 </tbody>
             </table>
         </div>
-    """
+    """)
 
-    content += """
+    content.write("""
         <div class="section">
             <h2 class="section-title">사용 예시</h2>
             <div style="display: grid; gap: 24px;">
@@ -1237,32 +1814,27 @@ def generate_width_page() -> str:
                 </div>
             </div>
         </div>
-    """
+    """)
 
-    return content
+    return content.getvalue()
 
 
 # ============================================
 # Fonts 페이지
 # ============================================
 
+@cached_extractor(FONTS_VARIABLES_FILE)
 def extract_fonts() -> Dict[str, str]:
     """Fonts 파일에서 font family 값을 추출합니다."""
     fonts = {}
-    if not FONTS_VARIABLES_FILE.exists():
+    scss = get_scss_index().file(FONTS_VARIABLES_FILE)
+    if scss is None:
         return fonts
     
-    with open(FONTS_VARIABLES_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
     # 전체 폰트 스택을 추출 (인용부호와 쉼표 포함)
-    pattern = r'\$font-([a-z0-9-]+):\s*([^;]+);'
-    matches = re.finditer(pattern, content)
-    
-    for match in matches:
-        key = match.group(1)
-        value = match.group(2).strip()
-        fonts[key] = value
+    for var_name, value in scss.variables:
+        if var_name.startswith('font-') and len(var_name) > len('font-'):
+            fonts[var_name[len('font-'):]] = value.strip()
     
     return fonts
 
@@ -1271,7 +1843,7 @@ def generate_fonts_page() -> str:
     """Fonts 페이지 생성"""
     fonts = extract_fonts()
     
-    content = """
+    content = HtmlBuilder("""
         <h1>Fonts</h1>
         <p class="subtitle">폰트 패밀리 변수 및 Google Material Icons</p>
         
@@ -1286,7 +1858,7 @@ def generate_fonts_page() -> str:
                     </tr>
                 </thead>
                 <tbody>
-    """
+    """)
     
     descriptions = {
         "basic": "기본 폰트",
@@ -1295,15 +1867,15 @@ def generate_fonts_page() -> str:
     
     for key, value in fonts.items():
         desc = descriptions.get(key, "")
-        content += f"""
+        content.write(f"""
                     <tr>
                         <td><code class="code">$font-{key}</code></td>
                         <td style="font-family: {value};"><code class="code">{value}</code></td>
                         <td>{desc}</td>
                     </tr>
-        """
+        """)
     
-    content += """
+    content.write("""
                 </tbody>
             </table>
         </div>
@@ -1440,9 +2012,9 @@ def generate_fonts_page() -> str:
                 <p style="margin-bottom: 0; color: #166534;">프로젝트별 선택적 폰트(Gmarket, Google Fonts, SCoreDream 등)는 각 프로젝트의 <code class="code">fonts/</code> 디렉토리에서 관리하세요.</p>
             </div>
         </div>
-    """
+    """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -1451,6 +2023,7 @@ def generate_fonts_page() -> str:
 
 BORDERS_FILE = ROOT_DIR / "utilities" / "_borders.scss"
 
+@cached_extractor(BORDERS_FILE)
 def extract_borders() -> Dict[str, List[str]]:
     """Borders 파일에서 border utility 클래스를 추출합니다."""
     borders = {
@@ -1461,45 +2034,30 @@ def extract_borders() -> Dict[str, List[str]]:
         "opacity": []
     }
     
-    if not BORDERS_FILE.exists():
+    scss = get_scss_index().file(BORDERS_FILE)
+    if scss is None:
         return borders
     
-    with open(BORDERS_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
+    rule_selectors = scss.rule_selectors()
     
     # Border Additive/Subtractive
-    pattern = r'\.(border(?:-[a-z0-9-]+)?)\s*{'
-    matches = re.finditer(pattern, content)
-    for match in matches:
-        class_name = match.group(1)
+    for class_name in rule_selectors:
         if class_name in ['border', 'border-0', 'border-top', 'border-top-0', 
                           'border-end', 'border-end-0', 'border-bottom', 'border-bottom-0',
                           'border-start', 'border-start-0']:
             borders["additive"].append(class_name)
     
     # Border Width
-    pattern = r'\.(border-[0-5])\s*{'
-    matches = re.finditer(pattern, content)
-    for match in matches:
-        borders["width"].append(match.group(1))
+    borders["width"] = [c for c in rule_selectors if Patterns.BORDER_WIDTH_CLASS.fullmatch(c)]
     
     # Border Color
-    pattern = r'\.(border-(?:primary|secondary|success|warning|danger|info|light|dark|white|black|positive|negative|neutral))\s*{'
-    matches = re.finditer(pattern, content)
-    for match in matches:
-        borders["color"].append(match.group(1))
+    borders["color"] = [c for c in rule_selectors if Patterns.BORDER_COLOR_CLASS.fullmatch(c)]
     
     # Border Radius
-    pattern = r'\.(rounded(?:-[a-z0-9-]+)?)\s*{'
-    matches = re.finditer(pattern, content)
-    for match in matches:
-        borders["radius"].append(match.group(1))
+    borders["radius"] = [c for c in rule_selectors if Patterns.BORDER_RADIUS_CLASS.fullmatch(c)]
     
     # Border Opacity
-    pattern = r'\.(border-opacity-(?:0|10|25|50|75|100))\s*{'
-    matches = re.finditer(pattern, content)
-    for match in matches:
-        borders["opacity"].append(match.group(1))
+    borders["opacity"] = [c for c in rule_selectors if Patterns.BORDER_OPACITY_CLASS.fullmatch(c)]
     
     return borders
 
@@ -1508,7 +2066,7 @@ def generate_borders_page() -> str:
     """Borders 페이지 생성"""
     borders = extract_borders()
     
-    content = """
+    content = HtmlBuilder("""
         <h1>Borders</h1>
         <p class="subtitle">Bootstrap 스타일의 border 유틸리티 클래스</p>
         
@@ -1662,9 +2220,9 @@ def generate_borders_page() -> str:
 &lt;div class="border border-success rounded-6"&gt;내용&lt;/div&gt;</code></pre>
             </div>
         </div>
-    """
+    """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -1675,7 +2233,7 @@ CONTAINER_FILE = ROOT_DIR / "utilities" / "_container.scss"
 
 def generate_container_page() -> str:
     """Container 페이지 생성"""
-    content = f"""
+    content = HtmlBuilder(f"""
         <h1>Container</h1>
         <p class="subtitle">반응형 최대 너비와 기본 gutter를 제공하는 레이아웃 컨테이너</p>
         <p style="margin-bottom: 24px; color: #64748b;">Bootstrap의 컨테이너 패턴을 참고하여 구성했습니다. <code class="code">.container</code>는 breakpoint별 <code class="code">max-width</code>를 적용하고, <code class="code">.container-fluid</code>는 항상 100% 너비를 사용합니다. 기본 padding과 row gap은 <code class="code">--rexbox-container-gutter-x</code> / <code class="code">--rexbox-row-gap</code> 변수로 제어할 수 있습니다.</p>
@@ -1771,9 +2329,9 @@ def generate_container_page() -> str:
                 </div>
             </div>
         </div>
-    """
+    """)
 
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -1784,7 +2342,7 @@ RESPONSIVE_FILE = ROOT_DIR / "utilities" / "_responsive.scss"
 
 def generate_responsive_page() -> str:
     """Responsive Utilities 페이지 생성"""
-    content = f"""
+    content = HtmlBuilder(f"""
         <h1>Responsive Utilities</h1>
         <p class="subtitle">모바일(≤ 768px)과 데스크톱(≥ 768px) 뷰포트에서만 동작하는 유틸리티 클래스</p>
         <p style="margin-bottom: 24px; color: #64748b;">RexBox의 breakpoint 믹스인을 기반으로 생성된 접두사 유틸리티입니다. <code class="code">mobile-</code> 접두사는 <code class="code">@include down(\"md\")</code>을, <code class="code">desktop-</code> 접두사는 <code class="code">@include up(\"md\")</code> 범위를 적용합니다.</p>
@@ -1942,9 +2500,9 @@ def generate_responsive_page() -> str:
                 </div>
             </div>
         </div>
-    """
+    """)
 
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -1955,7 +2513,7 @@ STACKS_FILE = ROOT_DIR / "utilities" / "_stacks.scss"
 
 def generate_stacks_page() -> str:
     """Stacks 페이지 생성"""
-    content = """
+    content = HtmlBuilder("""
         <h1>Stacks</h1>
         <p class="subtitle">Bootstrap 스타일의 stacks 유틸리티 클래스</p>
         <p style="margin-bottom: 24px; color: #64748b;">Flexbox를 기반으로 한 간단한 레이아웃 헬퍼입니다. <a href="https://getbootstrap.com/docs/5.3/helpers/stacks/" target="_blank" style="color: #2563eb; text-decoration: underline;">Bootstrap Stacks</a>를 참고했습니다.</p>
@@ -2057,9 +2615,9 @@ def generate_stacks_page() -> str:
             <h2 class="section-title">사용 방법</h2>
             <p style="margin-bottom: 16px; color: #64748b;">SCSS 파일에서 <code class="code">@use '../../rexbox/utilities' as *;</code> 또는 <code class="code">@use '../../rexbox' as *;</code>를 사용하면 자동으로 stacks 유틸리티 클래스가 포함됩니다.</p>
         </div>
-    """
+    """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -2070,7 +2628,7 @@ VERTICAL_RULE_FILE = ROOT_DIR / "utilities" / "_vertical-rule.scss"
 
 def generate_vertical_rule_page() -> str:
     """Vertical Rule 페이지 생성"""
-    content = """
+    content = HtmlBuilder("""
         <h1>Vertical Rule</h1>
         <p class="subtitle">Bootstrap 스타일의 vertical rule 유틸리티 클래스</p>
         <p style="margin-bottom: 24px; color: #64748b;">수직 구분선을 만드는 헬퍼 클래스입니다. <code class="code">&lt;hr&gt;</code> 요소와 유사한 스타일의 수직 구분선을 제공합니다. <a href="https://getbootstrap.com/docs/5.3/helpers/vertical-rule/" target="_blank" style="color: #2563eb; text-decoration: underline;">Bootstrap Vertical Rule</a>을 참고했습니다.</p>
@@ -2140,44 +2698,26 @@ def generate_vertical_rule_page() -> str:
             <h2 class="section-title">사용 방법</h2>
             <p style="margin-bottom: 16px; color: #64748b;">SCSS 파일에서 <code class="code">@use '../../rexbox/utilities' as *;</code> 또는 <code class="code">@use '../../rexbox' as *;</code>를 사용하면 자동으로 vertical rule 유틸리티 클래스가 포함됩니다.</p>
         </div>
-    """
+    """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
 # Mixins 페이지
 # ============================================
 
+@cached_extractor(*MIXIN_FILES.values())
 def extract_mixins() -> Dict[str, Dict[str, str]]:
     """Mixins 파일들에서 mixin 정보를 추출합니다."""
     mixins = {}
-    mixins_dir = ROOT_DIR / "mixins"
-    
-    mixin_files = {
-        "rounded": mixins_dir / "_rounded.scss",
-        "backdrop": mixins_dir / "_backdrop.scss",
-        "button-hover": mixins_dir / "_button-hover.scss",
-        "clearfix": mixins_dir / "_clearfix.scss",
-        "ellipsis": mixins_dir / "_ellipsis.scss",
-        "transform": mixins_dir / "_transform.scss",
-        "transition": mixins_dir / "_transition.scss",
-    }
     
-    for name, file_path in mixin_files.items():
-        if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+    index = get_scss_index()
+    for name, file_path in MIXIN_FILES.items():
+        scss = index.file(file_path)
+        if scss is not None:
             # Mixin 정의 찾기
-            pattern = r'@mixin\s+([a-z0-9-]+)\s*(?:\(([^)]*)\))?\s*{'
-            matches = re.finditer(pattern, content)
-            
-            mixin_list = []
-            for match in matches:
-                mixin_name = match.group(1)
-                params = match.group(2) if match.group(2) else ""
-                mixin_list.append({"name": mixin_name, "params": params})
+            mixin_list = [{"name": mixin_name, "params": params} for mixin_name, params in scss.mixins]
             
             if mixin_list:
                 mixins[name] = mixin_list
@@ -2189,14 +2729,14 @@ def generate_mixins_page() -> str:
     """Mixins 페이지 생성"""
     mixins = extract_mixins()
     
-    content = """
+    content = HtmlBuilder("""
         <h1>Mixins</h1>
         <p class="subtitle">사용 가능한 SCSS mixins</p>
-    """
+    """)
     
     # Rounded Mixins (권장)
     if "rounded" in mixins:
-        content += """
+        content.write("""
         <div class="section">
             <h2 class="section-title">Rounded Mixins (권장)</h2>
             <p style="margin-bottom: 16px; color: #64748b; font-size: 14px;">Bootstrap 스타일과 일관성을 위해 <code class="code">rounded</code> mixin을 권장합니다. 기존 <code class="code">border-radius</code> mixin은 하위 호환성을 위해 유지됩니다.</p>
@@ -2265,11 +2805,11 @@ def generate_mixins_page() -> str:
                 <p style="margin: 0; color: #92400e; font-size: 13px;"><strong>참고:</strong> 기존 <code class="code">@include border-radius()</code> mixin은 하위 호환성을 위해 계속 사용할 수 있지만, 새로운 코드에서는 <code class="code">@include rounded()</code> 사용을 권장합니다.</p>
             </div>
         </div>
-        """
+        """)
     
     # Backdrop Mixins
     if "backdrop" in mixins:
-        content += """
+        content.write("""
         <div class="section">
             <h2 class="section-title">Backdrop Mixins</h2>
             <table>
@@ -2304,11 +2844,11 @@ def generate_mixins_page() -> str:
                 </tbody>
             </table>
         </div>
-        """
+        """)
     
     # Button Hover Mixin
     if "button-hover" in mixins:
-        content += """
+        content.write("""
         <div class="section">
             <h2 class="section-title">Button Hover Mixin</h2>
             <table>
@@ -2328,11 +2868,11 @@ def generate_mixins_page() -> str:
                 </tbody>
             </table>
         </div>
-        """
+        """)
     
     # Clearfix Mixin
     if "clearfix" in mixins:
-        content += """
+        content.write("""
         <div class="section">
             <h2 class="section-title">Clearfix Mixin</h2>
             <table>
@@ -2352,11 +2892,11 @@ def generate_mixins_page() -> str:
                 </tbody>
             </table>
         </div>
-        """
+        """)
     
     # Ellipsis Mixin
     if "ellipsis" in mixins:
-        content += """
+        content.write("""
         <div class="section">
             <h2 class="section-title">Ellipsis Mixin</h2>
             <table>
@@ -2386,11 +2926,11 @@ def generate_mixins_page() -> str:
                 </tbody>
             </table>
         </div>
-        """
+        """)
     
     # Transform Mixins
     if "transform" in mixins:
-        content += """
+        content.write("""
         <div class="section">
             <h2 class="section-title">Transform Mixins</h2>
             <table>
@@ -2435,11 +2975,11 @@ def generate_mixins_page() -> str:
                 </tbody>
             </table>
         </div>
-        """
+        """)
     
     # Transition Mixins
     if "transition" in mixins:
-        content += """
+        content.write("""
         <div class="section">
             <h2 class="section-title">Transition Mixins</h2>
             <table>
@@ -2479,9 +3019,9 @@ def generate_mixins_page() -> str:
                 </tbody>
             </table>
         </div>
-        """
+        """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -2490,6 +3030,7 @@ def generate_mixins_page() -> str:
 
 BUTTONS_FILE = ROOT_DIR / "utilities" / "_buttons.scss"
 
+@cached_extractor(BUTTONS_FILE)
 def extract_buttons() -> Dict[str, List[str]]:
     """Buttons 파일에서 버튼 유틸리티를 추출합니다."""
     buttons = {
@@ -2499,15 +3040,18 @@ def extract_buttons() -> Dict[str, List[str]]:
         "palette": {"slate": [], "primary": [], "secondary": [], "point": []}
     }
     
-    if not BUTTONS_FILE.exists():
+    scss = get_scss_index().file(BUTTONS_FILE)
+    if scss is None:
         return buttons
     
-    with open(BUTTONS_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = scss.content
     
     # 기본 variants 추출
-    variant_pattern = r'\.btn-([a-z]+)\s*\{'
-    variants = re.findall(variant_pattern, content)
+    variants = []
+    for class_name in scss.rule_selectors():
+        match = Patterns.BUTTON_VARIANT_CLASS.fullmatch(class_name)
+        if match:
+            variants.append(match.group('variant'))
     buttons["variants"] = [v for v in variants if v not in ["outline", "ghost", "link", "sm", "lg", "disabled", "active"]]
     
     # Sizes 추출
@@ -2523,16 +3067,15 @@ def extract_buttons() -> Dict[str, List[str]]:
         buttons["states"].append("active")
     
     # Palette variants 추출
-    palette_patterns = {
-        "slate": r'\.btn-slate-(\d+)',
-        "primary": r'\.btn-primary-(\d+)',
-        "secondary": r'\.btn-secondary-(\d+)',
-        "point": r'\.btn-point-(\d+)'
-    }
-    
-    for palette_name, pattern in palette_patterns.items():
-        steps = sorted(set(re.findall(pattern, content)), key=lambda x: int(x))
-        buttons["palette"][palette_name] = steps
+    for palette_name in buttons["palette"]:
+        prefix = f"btn-{palette_name}-"
+        found = set()
+        for class_name, _ in scss.selectors:
+            if class_name.startswith(prefix):
+                match = Patterns.DIGITS.match(class_name, len(prefix))
+                if match:
+                    found.add(match.group(0))
+        buttons["palette"][palette_name] = sorted(found, key=lambda x: int(x))
     
     return buttons
 
@@ -2541,7 +3084,7 @@ def generate_buttons_page() -> str:
     """Buttons 페이지 생성"""
     buttons_data = extract_buttons()
     
-    content = """
+    content = HtmlBuilder("""
         <h1>Buttons</h1>
         <p class="subtitle">Bootstrap 스타일의 버튼 유틸리티 클래스</p>
         
@@ -2564,19 +3107,19 @@ def generate_buttons_page() -> str:
                     </tr>
                 </thead>
                 <tbody>
-    """
+    """)
     
     variants = ["primary", "secondary", "success", "warning", "danger", "info", "point"]
     for variant in variants:
-        content += f"""
+        content.write(f"""
                     <tr>
                         <td><code class="code">.btn-{variant}</code></td>
                         <td>{variant.capitalize()} 색상 버튼</td>
                         <td><button class="btn btn-{variant}" style="pointer-events: none;">{variant.capitalize()}</button></td>
                     </tr>
-        """
+        """)
     
-    content += """
+    content.write("""
                 </tbody>
             </table>
         </div>
@@ -2592,17 +3135,17 @@ def generate_buttons_page() -> str:
                     </tr>
                 </thead>
                 <tbody>
-    """
+    """)
     
     for variant in variants:
-        content += f"""
+        content.write(f"""
                     <tr>
                         <td><code class="code">.btn-outline-{variant}</code></td>
                         <td>{variant.capitalize()} 색상 outline 버튼</td>
                     </tr>
-        """
+        """)
     
-    content += """
+    content.write("""
                 </tbody>
             </table>
         </div>
@@ -2618,17 +3161,17 @@ def generate_buttons_page() -> str:
                     </tr>
                 </thead>
                 <tbody>
-    """
+    """)
     
     for variant in variants:
-        content += f"""
+        content.write(f"""
                     <tr>
                         <td><code class="code">.btn-ghost-{variant}</code></td>
                         <td>{variant.capitalize()} 색상 ghost 버튼</td>
                     </tr>
-        """
+        """)
     
-    content += """
+    content.write("""
                 </tbody>
             </table>
         </div>
@@ -2728,9 +3271,9 @@ def generate_buttons_page() -> str:
 &lt;button class="btn btn-primary btn-active"&gt;Active Button&lt;/button&gt;
 &lt;button class="btn btn-link"&gt;Link Button&lt;/button&gt;</code></pre>
         </div>
-        """
+        """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -2739,7 +3282,7 @@ def generate_buttons_page() -> str:
 
 def generate_sample_page() -> str:
     """Sample 페이지 생성 - 다양한 RexBox 클래스 테스트"""
-    content = """
+    content = HtmlBuilder("""
         <h1>Sample</h1>
         <p class="subtitle">RexBox의 다양한 유틸리티 클래스를 테스트해볼 수 있는 페이지입니다.</p>
         
@@ -2865,9 +3408,9 @@ def generate_sample_page() -> str:
                 <div class="bg-primary-subtle p-2 w-100">w-100</div>
             </div>
         </div>
-        """
+        """)
     
-    return content
+    return content.getvalue()
 
 
 # ============================================
@@ -2876,143 +3419,860 @@ def generate_sample_page() -> str:
 
 def generate_index_page() -> str:
     """Index 페이지 (Home/목차) 생성"""
-    content = """
+    content = HtmlBuilder("""
         <h1>RexBox Documentation</h1>
         <p class="subtitle">RexBox의 모든 변수와 설정값을 확인할 수 있는 사양서</p>
         
         <div class="section">
             <h2 class="section-title">카테고리</h2>
             <div class="grid" style="grid-template-columns: repeat(auto-fill, minmax(300px, 1fr)); gap: 24px;">
-    """
+    """)
     
-    # 모든 카테고리의 모든 아이템을 가져오기 (Home 제외)
-    for category in NAV_CATEGORIES:
-        for item in category["items"]:
-            if item["url"] != "index.html":  # Home 제외
-                content += f"""
-                <a href="{item["url"]}" style="text-decoration: none; color: inherit;">
+    # 레지스트리의 모든 페이지 (Home 제외)
+    for page in PAGES.values():
+        if page.slug != "index.html":  # Home 제외
+            content.write(f"""
+                <a href="{page.slug}" style="text-decoration: none; color: inherit;">
                     <div class="card" style="cursor: pointer; transition: transform 0.2s, box-shadow 0.2s;">
-                        <div class="card-title" style="font-size: 18px; margin-bottom: 8px;">{item["title"]}</div>
+                        <div class="card-title" style="font-size: 18px; margin-bottom: 8px;">{page.title}</div>
                         <div class="card-value" style="color: #64748b; font-size: 14px;">
-                            {item["title"]} 관련 변수와 설정값을 확인할 수 있습니다.
+                            {page.title} 관련 변수와 설정값을 확인할 수 있습니다.
                         </div>
                     </div>
                 </a>
-        """
+        """)
     
-    content += """
+    content.write("""
             </div>
         </div>
+    """)
+    
+    return content.getvalue()
+
+
+# ============================================
+# 페이지 레지스트리
+# ============================================
+# 모든 문서 페이지의 단일 정의입니다. 네비게이션, Home 카드, 빌드 순서, CLI가 모두 이 목록에서 나옵니다.
+# 증분 빌드(--changed)의 페이지 → SCSS 의존성은 빌드 중에 실제로 읽은 파일을 추적해
+# 빌드 매니페스트에 기록한 것을 쓰고, inputs는 아직 추적 기록이 없을 때만 사용합니다.
+
+class Page(NamedTuple):
+    """문서 페이지 하나의 정의"""
+    slug: str                       # 출력 파일 이름 (예: "theme.html")
+    title: str                      # 네비게이션, Home 카드, <title>에 쓰는 이름
+    category: str                   # 네비게이션 카테고리
+    generator: Callable[[], str]    # 본문 HTML 생성 함수
+    inputs: Tuple[Path, ...]        # 선언된 입력 SCSS 파일 (추적 기록이 없을 때 사용)
+
+
+PAGES: Dict[str, Page] = {page.slug: page for page in [
+    Page("index.html", "Home", "시작하기", generate_index_page, ()),
+    Page("sample.html", "Sample", "시작하기", generate_sample_page, ()),
+    Page("theme.html", "Theme", "시작하기", generate_colors_page,  # 기존 Colors 페이지
+         (VARIABLES_COLORS_FILE, THEME_FILE)),
+    Page("color-palettes.html", "Color Palettes", "기본 설정", generate_color_palettes_page,
+         (VARIABLES_COLORS_FILE,)),
+    Page("typography.html", "Typography", "기본 설정", generate_typography_page, (TYPOGRAPHY_FILE,)),
+    Page("fonts.html", "Fonts", "기본 설정", generate_fonts_page, (FONTS_VARIABLES_FILE,)),
+    Page("spacing.html", "Spacing", "기본 설정", generate_spacing_page, (SPACING_FILE,)),
+    Page("breakpoints.html", "Breakpoints", "레이아웃", generate_breakpoints_page, (BREAKPOINTS_FILE,)),
+    Page("container.html", "Container", "레이아웃", generate_container_page, (CONTAINER_FILE,)),
+    Page("width.html", "Width", "레이아웃", generate_width_page, (WIDTH_FILE,)),
+    Page("stacks.html", "Stacks", "레이아웃", generate_stacks_page, (STACKS_FILE,)),
+    Page("buttons.html", "Buttons", "컴포넌트", generate_buttons_page, (BUTTONS_FILE,)),
+    Page("borders.html", "Borders", "컴포넌트", generate_borders_page, (BORDERS_FILE,)),
+    Page("vertical-rule.html", "Vertical Rule", "컴포넌트", generate_vertical_rule_page, (VERTICAL_RULE_FILE,)),
+    Page("responsive.html", "Responsive", "반응형", generate_responsive_page, (RESPONSIVE_FILE,)),
+    Page("mixins.html", "Mixins", "개발자 도구", generate_mixins_page, tuple(MIXIN_FILES.values())),
+]}
+
+
+def nav_categories() -> List[Tuple[str, List[Page]]]:
+    """레지스트리 순서대로 (카테고리, 페이지 목록)을 반환합니다."""
+    categories: Dict[str, List[Page]] = {}
+    for page in PAGES.values():
+        categories.setdefault(page.category, []).append(page)
+    return list(categories.items())
+
+
+def page_inputs(page: str, manifest: Optional["BuildManifest"] = None) -> Tuple[Path, ...]:
+    """페이지가 읽는 입력 파일 (resolve된 경로)
+
+    마지막 빌드에서 추적한 목록을 우선 사용하고, 기록이 없으면 레지스트리에 선언된 입력을 씁니다.
     """
+    traced = (manifest or BuildManifest()).inputs(page)
+    if traced is not None:
+        return traced
+    return tuple(path.resolve() for path in PAGES[page].inputs)
+
+
+def affected_pages(changed_paths) -> List[str]:
+    """변경된 파일 경로들에 영향을 받는 페이지 목록을 반환합니다.
+
+    생성기 스크립트 자체가 바뀌면 모든 페이지가 대상입니다.
+    디렉토리 경로는 그 아래의 모든 입력 파일이 바뀐 것으로 봅니다.
+    어떤 페이지도 읽지 않는 SCSS 파일만 바뀌었다면 빈 목록입니다.
+    """
+    changed = {Path(path).resolve() for path in changed_paths}
+    if Path(__file__).resolve() in changed:
+        return list(PAGES)
     
-    return content
+    manifest = BuildManifest()
+    return [page for page in PAGES
+            if any(is_changed_path(path, changed) for path in page_inputs(page, manifest))]
 
 
 # ============================================
 # Main
 # ============================================
 
-def main():
-    """메인 함수 - 모든 페이지 생성"""
-    print("RexBox Documentation 생성 중...")
-    
+# 취소된 빌드의 종료 코드
+EXIT_CANCELLED = 3
+
+
+class BuildCancelled(Exception):
+    """페이지 사이의 취소 확인에서 새 변경이 감지되어 빌드를 중단함 (아무 페이지도 쓰지 않음)"""
+
+
+# SIGTERM을 받으면 True (watcher가 subprocess 빌드를 취소할 때 사용)
+_cancel_requested = False
+
+
+def _request_cancel(signum, frame):
+    global _cancel_requested
+    _cancel_requested = True
+
+
+def _check_cancel(should_cancel: Optional[Callable[[], bool]]) -> None:
+    if _cancel_requested or (should_cancel is not None and should_cancel()):
+        raise BuildCancelled()
+
+
+def render_page(page: str) -> str:
+    """페이지 하나를 완성된 HTML 문자열로 렌더링합니다."""
+    definition = PAGES[page]
+    fragments = get_fragment_cache()
+    if fragments is not None:
+        fragments.next_generation()
+    with profile_stage("page", definition.generator.__name__):
+        content = definition.generator()
+    return generate_html_page(definition.title, content, page)
+
+
+def render_page_traced(page: str) -> Tuple[str, Tuple[Path, ...]]:
+    """페이지를 렌더링하고 (HTML, 렌더링 중에 읽은 입력 파일 목록)을 반환합니다."""
+    with get_scss_index().trace() as reads:
+        html = render_page(page)
+    return html, tuple(sorted(reads))
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """내용이 다를 때만 임시 파일에 쓰고 원자적으로 교체합니다.
+
+    크기를 먼저 비교하고 같으면 바이트를 비교합니다. 내용이 같으면
+    파일을 건드리지 않아 mtime이 유지되고 watcher/브라우저가 다시 반응하지 않습니다.
+    실제로 썼으면 True를 반환합니다.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return True
+
+
+def _write_page(page: str, data: bytes) -> bool:
+    with profile_stage("write", page):
+        return write_if_changed(DOCS_DIR / page, data)
+
+
+MANIFEST_FILE = DOCS_DIR / ".build-manifest.json"
+MANIFEST_VERSION = 2
+
+
+def _manifest_path_key(path: Path) -> str:
+    """ROOT_DIR 아래 파일은 상대 경로로 기록해 체크아웃 위치와 무관하게 만듭니다."""
+    try:
+        return path.relative_to(ROOT_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+class BuildManifest:
+    """페이지별 입력 파일 digest, 생성기 코드 버전, 출력 digest 기록 (docs/.build-manifest.json)
+
+    입력 파일 목록은 렌더링 중에 실제로 읽은 파일을 추적한 것이며, 증분 빌드의 의존성 그래프로도 쓰입니다.
+    입력과 코드가 그대로이고 출력 파일이 기록된 digest와 같은 페이지는 렌더링 없이 건너뜁니다.
+    mtime 대신 내용 digest만 비교하므로 체크아웃/복원으로 mtime이 바뀐 CI에서도 정확합니다.
+    """
+
+    def __init__(self, path: Path = MANIFEST_FILE):
+        self.path = path
+        # 페이지 -> {"inputs": {경로: digest}, "output": digest}
+        self.pages: Dict[str, dict] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return
+        # 생성기 코드가 바뀌었으면 모든 기록이 무효
+        if data.get("version") == MANIFEST_VERSION and data.get("code") == generator_code_digest():
+            self.pages = data.get("pages", {})
+
+    def inputs(self, page: str) -> Optional[Tuple[Path, ...]]:
+        """마지막 빌드에서 추적한 입력 파일 목록. 기록이 없으면 None."""
+        entry = self.pages.get(page)
+        if entry is None:
+            return None
+        return tuple((ROOT_DIR.resolve() / key) for key in entry["inputs"])
+
+    @staticmethod
+    def input_digests(inputs) -> Dict[str, str]:
+        index = get_scss_index()
+        return {_manifest_path_key(path): index.digest(path) for path in inputs}
+
+    def is_up_to_date(self, page: str) -> bool:
+        entry = self.pages.get(page)
+        if entry is None or entry.get("inputs") != self.input_digests(self.inputs(page)):
+            return False
+        try:
+            output = (DOCS_DIR / page).read_bytes()
+        except FileNotFoundError:
+            return False
+        return hashlib.sha256(output).hexdigest() == entry.get("output")
+
+    def record(self, page: str, data: bytes, inputs) -> None:
+        self.pages[page] = {"inputs": self.input_digests(inputs), "output": hashlib.sha256(data).hexdigest()}
+
+    def save(self) -> None:
+        data = {"version": MANIFEST_VERSION, "code": generator_code_digest(),
+                "pages": {page: self.pages[page] for page in PAGES if page in self.pages}}
+        write_if_changed(self.path, (json.dumps(data, indent=2) + "\n").encode("utf-8"))
+
+
+def _warm_scss_index(pages: List[str], manifest: "BuildManifest") -> None:
+    """워커를 fork하기 전에 필요한 SCSS를 미리 읽어 두어 워커가 상속받게 합니다.
+
+    추출 캐시를 쓰면 워커는 캐시 키에 필요한 digest만 보므로 digest만 계산하고,
+    토큰화는 캐시 미스가 난 워커에 맡깁니다. 캐시가 꺼져 있으면 미리 토큰화합니다.
+    """
+    index = get_scss_index()
+    warm = index.digest if get_extract_cache() is not None else index.file
+    for page in pages:
+        for path in page_inputs(page, manifest):
+            warm(path)
+
+
+def _page_executor(jobs: int):
+    """fork가 가능하면 프로세스 풀, 아니면 스레드 풀을 사용합니다."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("fork"))
+    return ThreadPoolExecutor(max_workers=jobs)
+
+
+def _render_pages(pages: List[str], jobs: int, should_cancel: Optional[Callable[[], bool]],
+                  manifest: "BuildManifest") -> List[Tuple[str, Tuple[Path, ...]]]:
+    """페이지들을 pages 순서대로 (HTML, 읽은 입력 파일)로 렌더링합니다. 페이지 사이마다 취소 여부를 확인합니다."""
+    if jobs <= 1 or len(pages) <= 1:
+        rendered = []
+        for page in pages:
+            _check_cancel(should_cancel)
+            print(f"  - {page} 생성 중...")
+            rendered.append(render_page_traced(page))
+        return rendered
+    
+    _warm_scss_index(pages, manifest)
+    with _page_executor(min(jobs, len(pages))) as executor:
+        futures = [executor.submit(render_page_traced, page) for page in pages]
+        rendered = []
+        try:
+            for future in futures:
+                rendered.append(future.result())
+                _check_cancel(should_cancel)
+        except BuildCancelled:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    for page in pages:
+        print(f"  - {page} 생성 완료")
+    return rendered
+
+
+def build_pages(pages: List[str], jobs: int = 1,
+                should_cancel: Optional[Callable[[], bool]] = None,
+                force: bool = False) -> int:
+    """지정한 페이지들을 생성해 DOCS_DIR에 씁니다.
+
+    빌드 매니페스트상 최신인 페이지(입력, 코드, 출력 파일이 모두 그대로)는 렌더링하지 않습니다.
+    force가 True면 매니페스트와 관계없이 모두 렌더링합니다.
+    모든 페이지를 먼저 렌더링한 뒤에 씁니다. 페이지 렌더링 사이마다 should_cancel()
+    (또는 SIGTERM)을 확인해 취소되면 BuildCancelled를 발생시키므로, 일부 페이지만
+    새 상태로 쓰인 문서가 남지 않습니다.
+    jobs가 2 이상이면 페이지를 병렬로 렌더링하고, 최대 jobs개씩 동시에 씁니다.
+    결과는 항상 pages 순서대로 모아서 쓰므로 출력은 jobs와 관계없이 같습니다.
+    내용이 실제로 바뀐 페이지 수를 반환합니다.
+    """
     DOCS_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Index 페이지
-    print("  - index.html 생성 중...")
-    index_content = generate_index_page()
-    with open(DOCS_DIR / "index.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Home", index_content, "index.html"))
-    
-    # Breakpoints 페이지
-    print("  - breakpoints.html 생성 중...")
-    breakpoints_content = generate_breakpoints_page()
-    with open(DOCS_DIR / "breakpoints.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Breakpoints", breakpoints_content, "breakpoints.html"))
-    
-    # Typography 페이지
-    print("  - typography.html 생성 중...")
-    typography_content = generate_typography_page()
-    with open(DOCS_DIR / "typography.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Typography", typography_content, "typography.html"))
-    
-    # Spacing 페이지
-    print("  - spacing.html 생성 중...")
-    spacing_content = generate_spacing_page()
-    with open(DOCS_DIR / "spacing.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Spacing", spacing_content, "spacing.html"))
-    
-    # Width 페이지
-    print("  - width.html 생성 중...")
-    width_content = generate_width_page()
-    with open(DOCS_DIR / "width.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Width", width_content, "width.html"))
-    
-    # Container 페이지
-    print("  - container.html 생성 중...")
-    container_content = generate_container_page()
-    with open(DOCS_DIR / "container.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Container", container_content, "container.html"))
-    
-    # Borders 페이지
-    print("  - borders.html 생성 중...")
-    borders_content = generate_borders_page()
-    with open(DOCS_DIR / "borders.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Borders", borders_content, "borders.html"))
-    
-    # Buttons 페이지
-    print("  - buttons.html 생성 중...")
-    buttons_content = generate_buttons_page()
-    with open(DOCS_DIR / "buttons.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Buttons", buttons_content, "buttons.html"))
-    
-    # Stacks 페이지
-    print("  - stacks.html 생성 중...")
-    stacks_content = generate_stacks_page()
-    with open(DOCS_DIR / "stacks.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Stacks", stacks_content, "stacks.html"))
-    
-    # Responsive 페이지
-    print("  - responsive.html 생성 중...")
-    responsive_content = generate_responsive_page()
-    with open(DOCS_DIR / "responsive.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Responsive", responsive_content, "responsive.html"))
-    
-    # Vertical Rule 페이지
-    print("  - vertical-rule.html 생성 중...")
-    vertical_rule_content = generate_vertical_rule_page()
-    with open(DOCS_DIR / "vertical-rule.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Vertical Rule", vertical_rule_content, "vertical-rule.html"))
-    
-    # Fonts 페이지
-    print("  - fonts.html 생성 중...")
-    fonts_content = generate_fonts_page()
-    with open(DOCS_DIR / "fonts.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Fonts", fonts_content, "fonts.html"))
-    
-    # Theme 페이지 (기존 Colors 페이지)
-    print("  - theme.html 생성 중...")
-    theme_content = generate_colors_page()
-    with open(DOCS_DIR / "theme.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Theme", theme_content, "theme.html"))
-    
-    # Color Palettes 페이지
-    print("  - color-palettes.html 생성 중...")
-    color_palettes_content = generate_color_palettes_page()
-    with open(DOCS_DIR / "color-palettes.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Color Palettes", color_palettes_content, "color-palettes.html"))
-    
-    # Mixins 페이지
-    print("  - mixins.html 생성 중...")
-    mixins_content = generate_mixins_page()
-    with open(DOCS_DIR / "mixins.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Mixins", mixins_content, "mixins.html"))
-    
-    # Sample 페이지
-    print("  - sample.html 생성 중...")
-    sample_content = generate_sample_page()
-    with open(DOCS_DIR / "sample.html", 'w', encoding='utf-8') as f:
-        f.write(generate_html_page("Sample", sample_content, "sample.html"))
+    manifest = BuildManifest()
+    if not force:
+        up_to_date = {page for page in pages if manifest.is_up_to_date(page)}
+        if up_to_date:
+            print(f"  - 최신 상태인 {len(up_to_date)}개 페이지 건너뜀 ({MANIFEST_FILE.name})")
+            pages = [page for page in pages if page not in up_to_date]
+    if not pages:
+        return 0
+    
+    results = _render_pages(pages, jobs, should_cancel, manifest)
+    _check_cancel(should_cancel)
+    rendered = [html.encode('utf-8') for html, _ in results]
+    
+    if jobs <= 1 or len(pages) <= 1:
+        changed = sum(_write_page(page, data) for page, data in zip(pages, rendered))
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as writer:
+            changed = sum(writer.map(_write_page, pages, rendered))
+    
+    for page, data, (_, inputs) in zip(pages, rendered, results):
+        manifest.record(page, data, inputs)
+    manifest.save()
+    return changed
+
+
+def rebuild(changed_paths=None, jobs: int = 1,
+            should_cancel: Optional[Callable[[], bool]] = None,
+            profiler: Optional[BuildProfiler] = None) -> Tuple[List[str], int]:
+    """상주 프로세스(watcher)용 재생성 함수
+
+    모듈을 한 번 로드해 둔 상태에서 호출하면 파싱된 SCSS 인덱스를 유지한 채
+    변경된 파일만 다시 읽고, 영향을 받는 페이지만 생성합니다.
+    changed_paths가 None이면 인덱스를 비우고 모든 페이지를 생성합니다.
+    should_cancel()이 True를 반환하면 페이지 경계에서 BuildCancelled를 발생시킵니다
+    (무효화된 인덱스는 그대로 두므로 합친 경로로 다시 호출하면 됩니다).
+    profiler를 주면 이번 재생성의 단계별 시간을 기록합니다 (watcher 지연 시간 지표).
+    (대상 페이지 목록, 내용이 실제로 바뀐 페이지 수)를 반환합니다.
+    """
+    global _profiler
+    if changed_paths is None:
+        reset_scss_index()
+        pages = list(PAGES)
+    else:
+        get_scss_index().invalidate(changed_paths)
+        pages = affected_pages(changed_paths)
+    
+    changed = 0
+    if pages:
+        _profiler = profiler
+        try:
+            changed = build_pages(pages, jobs, should_cancel)
+        finally:
+            _profiler = None
+        print(f"  {len(pages)}개 페이지 중 {changed}개 변경됨")
+        prune_caches()
+    return pages, changed
+
+
+# ============================================
+# 데몬 모드 (Unix 소켓)
+# ============================================
+
+DAEMON_SOCKET = CACHE_DIR / "daemon.sock"
+
+
+def handle_daemon_request(request: dict, jobs: int = 1) -> dict:
+    """데몬 요청 하나를 처리합니다.
+
+    요청: {"changed": [경로, ...]} 이면 해당 파일에 의존하는 페이지만, 없으면 모든 페이지를 생성합니다.
+    메모리에 있는 SCSS 중 디스크에서 바뀐 파일은 요청과 관계없이 다시 읽습니다.
+    """
+    index = get_scss_index()
+    stale = index.stale_paths()
+    if stale:
+        index.invalidate(stale)
+    
+    changed_paths = request.get("changed")
+    if changed_paths:
+        index.invalidate(changed_paths)
+        pages = affected_pages(changed_paths)
+    else:
+        pages = list(PAGES)
+    
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        if pages:
+            changed = build_pages(pages, jobs)
+            print(f"  {len(pages)}개 페이지 중 {changed}개 변경됨")
+            prune_caches()
+        else:
+            changed = 0
+            print("변경된 파일에 의존하는 문서 페이지가 없습니다.")
+    return {"ok": True, "pages": pages, "changed": changed, "output": output.getvalue()}
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """한 줄 JSON 요청을 받아 한 줄 JSON 응답을 돌려줍니다."""
+
+    def handle(self):
+        server = self.server
+        line = self.rfile.readline()
+        if not line:
+            return  # 요청 없이 끊은 연결 (daemon_running 확인 등)
+        server.busy = True
+        try:
+            request = json.loads(line)
+            if file_stat_key(os.stat(__file__)) != server.code_stat:
+                # 생성기 코드가 바뀌었으면 오래된 상태로 빌드하지 않고 종료 (클라이언트가 직접 빌드)
+                response = {"ok": False, "restart": True, "error": "생성기 코드가 바뀌어 데몬을 종료합니다."}
+                server.stop_requested = True
+            else:
+                response = handle_daemon_request(request, server.jobs)
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        finally:
+            server.busy = False
+        with contextlib.suppress(BrokenPipeError):
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+def daemon_running(socket_path: Path) -> bool:
+    """socket_path에서 응답하는 데몬이 있는지 확인합니다."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+            return True
+        except OSError:
+            return False
+
+
+def run_daemon(socket_path: Path, jobs: int = 1) -> None:
+    """파싱된 rexbox/ 상태를 메모리에 유지하며 Unix 소켓으로 재생성 요청을 받습니다."""
+    if socket_path.exists():
+        if daemon_running(socket_path):
+            raise SystemExit(f"이미 데몬이 실행 중입니다: {socket_path}")
+        socket_path.unlink()  # 비정상 종료로 남은 소켓 파일
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # 시작할 때 모든 입력을 한 번 읽어 두어 첫 요청도 빠르게 처리
+    reset_scss_index()
+    _warm_scss_index(list(PAGES), BuildManifest())
+    
+    server = socketserver.UnixStreamServer(str(socket_path), DaemonRequestHandler)
+    server.jobs = jobs
+    server.code_stat = file_stat_key(os.stat(__file__))
+    server.stop_requested = False
+    server.busy = False
+    
+    def request_stop(signum, frame):
+        # 요청 처리 중이면 응답을 보낸 뒤 종료, 대기 중이면 바로 종료
+        # (정리 중에 또 받은 SIGTERM은 무시)
+        if server.stop_requested:
+            return
+        server.stop_requested = True
+        if not server.busy:
+            raise KeyboardInterrupt
+    
+    signal.signal(signal.SIGTERM, request_stop)
+    print(f"📡 문서 데몬 대기 중: {socket_path} (Ctrl+C로 종료)")
+    try:
+        while not server.stop_requested:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(FileNotFoundError):
+            socket_path.unlink()
+        prune_caches()
+        print("👋 문서 데몬을 종료합니다.")
+
+
+# ============================================
+# 개발 서버 (serve 모드)
+# ============================================
+
+LIVE_RELOAD_PATH = "/__livereload"
+LIVE_RELOAD_SCRIPT = f"""<script>
+new EventSource("{LIVE_RELOAD_PATH}").onmessage = function (event) {{
+    if (event.data === (location.pathname.split("/").pop() || "index.html")) location.reload();
+}};
+</script>
+"""
+
+
+class RenderCache:
+    """입력 파일 digest를 키로 하는 메모리 페이지 캐시 (serve 모드)
+
+    페이지는 처음 요청될 때 렌더링하고, 입력 SCSS의 digest가 바뀌었을 때만 다시 렌더링합니다.
+    디스크의 docs/*.html은 건드리지 않습니다.
+    """
+
+    def __init__(self):
+        # 페이지 -> (입력 키, 응답 본문, ETag, 렌더링 중에 읽은 입력 파일)
+        self._pages: Dict[str, Tuple[str, bytes, str, Tuple[Path, ...]]] = {}
+        # SCSS 인덱스와 프로파일러는 스레드 안전하지 않으므로 렌더링을 직렬화
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def input_key(page: str, inputs: Tuple[Path, ...]) -> str:
+        index = get_scss_index()
+        hasher = hashlib.sha256(generator_code_digest().encode())
+        hasher.update(page.encode())
+        for path in inputs:
+            hasher.update(index.digest(path).encode())
+        return hasher.hexdigest()
+
+    def get(self, page: str) -> Tuple[bytes, str]:
+        """(HTML 본문, ETag)를 반환합니다. 입력이 바뀌었으면 다시 렌더링합니다."""
+        with self._lock:
+            cached = self._pages.get(page)
+            if cached is None or cached[0] != self.input_key(page, cached[3]):
+                html, inputs = render_page_traced(page)
+                body = html.replace("</body>", LIVE_RELOAD_SCRIPT + "</body>", 1).encode("utf-8")
+                etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+                cached = self._pages[page] = (self.input_key(page, inputs), body, etag, inputs)
+            return cached[1], cached[2]
+
+    def refresh(self) -> List[str]:
+        """디스크에서 바뀐 SCSS를 다시 읽고, 이미 렌더링한 페이지 중 결과가 바뀐 페이지 목록을 반환합니다.
+
+        입력 digest가 바뀐 페이지만 다시 렌더링하며, 주석만 바뀐 경우처럼 HTML이 같으면 알리지 않습니다.
+        """
+        with self._lock:
+            index = get_scss_index()
+            stale = index.stale_paths()
+            if not stale:
+                return []
+            index.invalidate(stale)
+            changed = []
+            for page, (key, _, etag, inputs) in list(self._pages.items()):
+                if self.input_key(page, inputs) != key and self.get(page)[1] != etag:
+                    changed.append(page)
+            return changed
+
+
+class LiveReload:
+    """Server-Sent Events 구독자에게 바뀐 페이지 이름을 보냅니다."""
+
+    def __init__(self):
+        self._clients: List[queue.Queue] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> queue.Queue:
+        client = queue.Queue()
+        with self._lock:
+            self._clients.append(client)
+        return client
+
+    def unsubscribe(self, client: queue.Queue) -> None:
+        with self._lock:
+            self._clients.remove(client)
+
+    def publish(self, page: str) -> None:
+        with self._lock:
+            for client in self._clients:
+                client.put(page)
+
+
+class DocsRequestHandler(SimpleHTTPRequestHandler):
+    """생성 페이지는 메모리 캐시에서, 나머지(css, assets)는 docs/에서 제공합니다."""
+
+    render_cache: RenderCache
+    live_reload: LiveReload
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(DOCS_DIR), **kwargs)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == LIVE_RELOAD_PATH:
+            self.send_events()
+            return
+        page = path.lstrip("/") or "index.html"
+        if page not in PAGES:
+            super().do_GET()
+            return
+
+        body, etag = self.render_cache.get(page)
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_events(self):
+        """연결이 끊길 때까지 바뀐 페이지 이름을 이벤트로 보냅니다."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        client = self.live_reload.subscribe()
+        try:
+            while True:
+                try:
+                    message = f"data: {client.get(timeout=15)}\n\n"
+                except queue.Empty:
+                    message = ": keep-alive\n\n"  # 끊긴 연결을 감지하기 위한 주석 이벤트
+                self.wfile.write(message.encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.live_reload.unsubscribe(client)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 로그를 남기지 않음
+
+
+def watch_render_inputs(render_cache: RenderCache, live_reload: LiveReload, interval: float) -> None:
+    """interval마다 렌더링한 페이지의 입력 파일 stat을 확인해 바뀐 페이지를 알립니다."""
+    while True:
+        time.sleep(interval)
+        changed = render_cache.refresh()
+        for page in changed:
+            print(f"  ↻ {page}")
+            live_reload.publish(page)
+        if changed:
+            prune_caches()
+
+
+def run_server(host: str, port: int, interval: float = 0.5) -> None:
+    """docs/를 로컬 포트로 제공합니다. 페이지는 첫 요청 때 메모리에서 렌더링합니다."""
+    render_cache = RenderCache()
+    live_reload = LiveReload()
+    handler = type("BoundDocsRequestHandler", (DocsRequestHandler,),
+                   {"render_cache": render_cache, "live_reload": live_reload})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=watch_render_inputs, args=(render_cache, live_reload, interval),
+                     name="render-inputs", daemon=True).start()
+    print(f"🌐 문서 서버: http://{host}:{port}/ (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 문서 서버를 종료합니다.")
+    finally:
+        server.server_close()
+
+
+def positive_int(value: str) -> int:
+    """1 이상의 정수 (--jobs)"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+
+def parse_page_list(value: str) -> List[str]:
+    """'theme,buttons.html' 형식을 레지스트리의 페이지 이름 목록으로 바꿉니다 (--only)."""
+    pages = []
+    for name in filter(None, (part.strip() for part in value.split(","))):
+        slug = name if name.endswith(".html") else f"{name}.html"
+        if slug not in PAGES:
+            raise argparse.ArgumentTypeError(
+                f"알 수 없는 페이지: {name} (가능한 값: {', '.join(slug[:-5] for slug in PAGES)})")
+        pages.append(slug)
+    return pages
+
+
+def git_changed_files(rev: str) -> List[Path]:
+    """rev 이후 바뀐 파일 (커밋된 변경과 작업 트리의 변경 모두) 의 절대 경로 목록"""
+    try:
+        top = subprocess.run(["git", "rev-parse", "--show-toplevel"], cwd=ROOT_DIR, check=True,
+                             capture_output=True, text=True).stdout.strip()
+    except FileNotFoundError:
+        raise SystemExit("--changed-since에는 git이 필요합니다.")
+    except subprocess.CalledProcessError as e:
+        raise SystemExit(f"{ROOT_DIR}의 git 저장소를 찾을 수 없습니다: {e.stderr.strip()}")
+    try:
+        names = subprocess.run(["git", "diff", "--name-only", rev, "--"], cwd=top, check=True,
+                               capture_output=True, text=True).stdout.splitlines()
+    except subprocess.CalledProcessError as e:
+        raise SystemExit(f"git diff 실패 ({rev}): {e.stderr.strip()}")
+    return [Path(top) / name for name in names]
+
+
+def _display_path(path: Path) -> str:
+    return str(Path(ROOT_DIR.name) / _manifest_path_key(path))
+
+
+def print_dependency_report(pages: List[str]) -> None:
+    """추적한 입력과 레지스트리에 선언된 입력이 다른 페이지를 출력합니다 (--trace-deps)."""
+    manifest = BuildManifest()
+    print()
+    print("추적한 페이지 의존성:")
+    for page in pages:
+        traced = set(manifest.inputs(page) or ())
+        declared = {path.resolve() for path in PAGES[page].inputs}
+        print(f"  {page:<22} {', '.join(_display_path(path) for path in sorted(traced)) or '-'}")
+        for path in sorted(declared - traced):
+            print(f"    - 선언했지만 읽지 않음: {_display_path(path)}")
+        for path in sorted(traced - declared):
+            print(f"    + 읽었지만 선언하지 않음: {_display_path(path)}")
+
+
+def select_pages(args: argparse.Namespace) -> List[str]:
+    """명령행 인자에 따라 생성할 페이지 목록을 레지스트리 순서로 고릅니다."""
+    pages = list(PAGES)
+    if args.changed or args.changed_since:
+        changed_paths = list(args.changed or [])
+        if args.changed_since:
+            changed_paths += git_changed_files(args.changed_since)
+        pages = affected_pages(changed_paths)
+    if args.only:
+        pages = [page for page in pages if page in args.only]
+    return pages
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="RexBox 문서 생성기")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"추출 결과 디스크 캐시({CACHE_DIR})와 HTML 조각 캐시를 사용하지 않습니다.")
+    parser.add_argument("--jobs", "-j", type=positive_int, default=1, metavar="N",
+                        help="N개의 워커로 페이지를 병렬 렌더링합니다 (기본값: 1).")
+    parser.add_argument("--changed", nargs="+", metavar="PATH",
+                        help="변경된 SCSS 파일 경로. 이 파일에 의존하는 페이지만 다시 생성합니다.")
+    parser.add_argument("--changed-since", metavar="REV",
+                        help="git diff --name-only REV로 찾은 변경 파일에 의존하는 페이지만 다시 생성합니다 (예: HEAD~1).")
+    parser.add_argument("--only", type=parse_page_list, metavar="PAGES",
+                        help="쉼표로 구분한 페이지만 생성합니다 (예: theme,buttons). --changed와 함께 쓰면 교집합입니다.")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="생성할 페이지 목록만 출력하고 파일은 쓰지 않습니다.")
+    parser.add_argument("--force", action="store_true",
+                        help=f"빌드 매니페스트({MANIFEST_FILE.name})와 관계없이 선택한 페이지를 모두 다시 렌더링합니다.")
+    parser.add_argument("--trace-deps", action="store_true",
+                        help="선택한 페이지를 모두 다시 렌더링해 실제로 읽은 파일을 의존성으로 기록하고, "
+                             "레지스트리에 선언된 입력과 다른 부분을 출력합니다.")
+    parser.add_argument("--profile", action="store_true",
+                        help="추출/페이지 생성/파일 쓰기 단계별 wall·CPU 시간을 표로 출력하고 JSON으로 저장합니다.")
+    parser.add_argument("--profile-output", type=Path, metavar="PATH",
+                        help="--profile 결과 JSON 경로 (기본값: docs/.cache/profile.json). "
+                             "--profile 없이 지정하면 표를 출력하지 않고 JSON만 저장합니다.")
+    parser.add_argument("--daemon", action="store_true",
+                        help="파싱 상태를 메모리에 유지하고 Unix 소켓으로 재생성 요청을 받습니다 (클라이언트: docs-client.py).")
+    parser.add_argument("--socket", type=Path, default=DAEMON_SOCKET, metavar="PATH",
+                        help="--daemon 소켓 경로 (기본값: docs/.cache/daemon.sock)")
+    parser.add_argument("--serve", action="store_true",
+                        help="docs/를 로컬 포트로 제공합니다. 페이지는 메모리에서 렌더링하고 SCSS가 바뀌면 브라우저를 새로 고칩니다.")
+    parser.add_argument("--host", default="127.0.0.1", help="--serve 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="--serve 포트 (기본값: 8000)")
+    parser.add_argument("--cprofile", metavar="PAGE", choices=list(PAGES),
+                        help="지정한 페이지(예: color-palettes.html) 렌더링을 cProfile로 측정해 .pstats로 저장합니다.")
+    parser.add_argument("--list", action="store_true",
+                        help="레지스트리의 페이지와 입력 SCSS 파일 목록을 출력합니다 (추적 기록이 있으면 추적한 목록).")
+    return parser.parse_args(argv)
+
+
+def run_cprofile(page: str) -> Path:
+    """한 페이지의 렌더링을 cProfile로 측정하고 .pstats 파일 경로를 반환합니다."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    stats_path = CACHE_DIR / f"{page}.pstats"
+    profiler = cProfile.Profile()
+    profiler.runcall(render_page, page)
+    profiler.dump_stats(str(stats_path))
+    return stats_path
+
+
+def main(argv: Optional[List[str]] = None):
+    """메인 함수 - 모든 페이지 생성"""
+    args = parse_args(argv)
+    if args.list:
+        manifest = BuildManifest()
+        for category, pages in nav_categories():
+            print(category)
+            for page in pages:
+                inputs = ", ".join(_display_path(path) for path in page_inputs(page.slug, manifest))
+                source = "" if manifest.inputs(page.slug) is not None else "  (선언값, 추적 기록 없음)"
+                print(f"  {page.slug:<22} {page.title:<16} {inputs or '-'}{source}")
+        return
+    configure_extract_cache(enabled=not args.no_cache)
+    
+    if args.daemon:
+        run_daemon(args.socket, args.jobs)
+        return
+    if args.serve:
+        run_server(args.host, args.port)
+        return
+    
+    pages = select_pages(args)
+    if args.dry_run:
+        manifest = BuildManifest()
+        print(f"생성할 페이지 ({len(pages)}/{len(PAGES)}):")
+        for page in pages:
+            skipped = not args.force and manifest.is_up_to_date(page)
+            print(f"  - {page}" + (" (최신, 건너뜀)" if skipped else ""))
+        return
+    if not pages:
+        print("변경된 파일에 의존하는 문서 페이지가 없습니다.")
+        return
+    if len(pages) < len(PAGES):
+        print(f"RexBox Documentation 증분 생성 중... ({len(pages)}/{len(PAGES)} 페이지)")
+    else:
+        print("RexBox Documentation 생성 중...")
+    
+    global _profiler
+    jobs = args.jobs
+    if args.profile or args.profile_output:
+        _profiler = BuildProfiler()
+        if jobs > 1:
+            # 워커 프로세스의 시간은 모을 수 없으므로 순차 실행
+            print("  (--profile: 단계별 시간을 정확히 재기 위해 --jobs 1로 실행합니다)")
+            jobs = 1
+    
+    # 빌드마다 SCSS 파일을 한 번씩만 읽도록 인덱스 초기화
+    reset_scss_index()
+    
+    # watcher가 더 새로운 변경으로 이 빌드를 대체할 때 SIGTERM을 보냄
+    signal.signal(signal.SIGTERM, _request_cancel)
+    try:
+        changed = build_pages(pages, jobs, force=args.force or args.trace_deps)
+    except BuildCancelled:
+        print("  빌드가 취소되었습니다 (문서를 쓰지 않음).")
+        sys.exit(EXIT_CANCELLED)
+    print(f"  {len(pages)}개 페이지 중 {changed}개 변경됨")
+    if args.trace_deps:
+        print_dependency_report(pages)
+    
+    if _profiler is not None:
+        profile_output = args.profile_output or CACHE_DIR / "profile.json"
+        if args.profile:
+            print()
+            print(_profiler.format_table())
+            print(f"  (프로파일 저장: {profile_output})")
+        _profiler.save_json(profile_output)
+        _profiler = None
+    
+    if args.cprofile:
+        # 인덱스를 비워 파싱 비용까지 포함해 측정
+        reset_scss_index()
+        stats_path = run_cprofile(args.cprofile)
+        print(f"  (cProfile 저장: {stats_path} - python3 -m pstats {stats_path})")
+    
+    prune_caches()
+    cache = get_extract_cache()
+    if cache is not None:
+        print(f"  (추출 캐시: 적중 {cache.hits}, 미스 {cache.misses})")
     
     print(f"✓ 모든 문서가 {DOCS_DIR} 디렉토리에 생성되었습니다!")
 
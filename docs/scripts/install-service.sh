@@ -62,6 +62,9 @@ if [ $? -eq 0 ]; then
     echo "📋 로그 확인:"
     echo "   tail -f /tmp/rexbox-docs-watcher.log"
     echo ""
+    echo "📈 지연 시간 지표 (Prometheus):"
+    echo "   curl http://127.0.0.1:9477/metrics"
+    echo ""
     echo "🛑 서비스 중지:"
     echo "   launchctl unload $LAUNCH_AGENTS_DIR/$PLIST_NAME"
     echo ""
@@ -9,9 +9,8 @@ if [ -d "venv" ]; then
     source venv/bin/activate
 fi
 
-# watchdog 패키지 확인 및 설치 안내
-python3 -c "import watchdog" 2>/dev/null
-if [ $? -ne 0 ]; then
+# watchdog 패키지 확인 및 설치 안내 (Linux는 inotify 백엔드를 사용하므로 필요 없음)
+if [ "$(uname -s)" != "Linux" ] && ! python3 -c "import watchdog" 2>/dev/null; then
     echo "⚠️  watchdog 패키지가 필요합니다."
     echo ""
     echo "설치 방법 (macOS):"
@@ -2,46 +2,394 @@
 """
 RexBox Documentation File Watcher
 SCSS 파일이 변경될 때마다 자동으로 모든 문서 페이지를 생성합니다.
+
+감시 백엔드:
+- inotify: Linux 기본값. ctypes로 커널 inotify를 직접 사용하며 외부 패키지가 필요 없습니다.
+- watchdog: macOS 등 (watchdog 패키지 필요)
+- polling: inotify가 동작하지 않는 네트워크 마운트/컨테이너용. stat 인덱스를 주기적으로 다시 훑습니다.
 """
 
+import argparse
+import collections
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import importlib.util
+import json
+import os
+import select
+import signal
+import struct
 import sys
+import threading
 import time
 import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
-# macOS/Linux용 (watchdog 패키지 필요)
+# macOS용 (watchdog 패키지 필요, Linux에서는 선택 사항)
 try:
     from watchdog.observers import Observer
     from watchdog.events import FileSystemEventHandler
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
+
+    class FileSystemEventHandler:
+        """watchdog이 없을 때 사용하는 빈 베이스 클래스 (inotify 백엔드는 on_* 메서드를 직접 호출)"""
+
+
+def print_watchdog_install_help():
     print("⚠️  watchdog 패키지가 설치되지 않았습니다.")
     print("   설치 (macOS): python3 -m pip install --user --break-system-packages watchdog")
     print("   설치 (가상환경): python3 -m venv venv && source venv/bin/activate && pip install watchdog")
     print("   설치 (일반): pip3 install watchdog")
+    print("   Linux에서는 watchdog 없이 --backend inotify를 사용할 수 있습니다.")
     print("   또는 Git pre-commit hook을 사용하세요.")
-    sys.exit(1)
+
+
+# 생성기(generate-docs.py)가 취소된 빌드에 사용하는 종료 코드
+EXIT_CANCELLED = 3
+
+# 재생성 결과
+REBUILD_DONE = "done"
+REBUILD_CANCELLED = "cancelled"
+REBUILD_FAILED = "failed"
+
+
+def load_generator(script_path):
+    """generate-docs.py를 모듈로 한 번만 로드합니다 (상주 모드)."""
+    spec = importlib.util.spec_from_file_location("rexbox_generate_docs", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ChangeBatcher:
+    """변경된 경로를 모았다가 한 번에 처리하는 trailing-edge debounce 큐
+    
+    이벤트가 quiet_window 동안 더 들어오지 않으면 모인 경로 전체로 on_batch를 한 번 호출합니다.
+    이벤트가 계속 들어와도 첫 이벤트 후 max_latency가 지나면 바로 처리해,
+    긴 연속 저장(포매터, git checkout 등)이 재생성을 무한히 미루지 않게 합니다.
+    
+    재생성 중에 들어온 이벤트는 다음 배치로 모입니다. on_batch(batch, should_cancel)는
+    should_cancel()로 새 배치가 준비되었는지 확인해 진행 중인 재생성을 중단할 수 있고,
+    False를 반환하면 그 배치의 경로를 새 배치에 합쳐 바로 다시 처리합니다.
+    """
+    
+    def __init__(self, on_batch, quiet_window=0.5, max_latency=3.0):
+        self.on_batch = on_batch
+        self.quiet_window = quiet_window
+        self.max_latency = max_latency
+        self._cond = threading.Condition()
+        self._pending = {}  # 경로 -> 처음 들어온 시각 (삽입 순서 유지)
+        self._first_event = None
+        self._last_event = None
+        self._stopped = False
+        # 마지막으로 꺼낸 배치의 경로별 첫 이벤트 시각과 꺼낸 시각 (지연 시간 지표용)
+        self.batch_events = {}
+        self.batch_dispatched = None
+        self._thread = threading.Thread(target=self._run, name="docs-rebuild", daemon=True)
+        self._thread.start()
+    
+    def add(self, path):
+        """변경된 경로를 큐에 추가합니다."""
+        now = time.monotonic()
+        with self._cond:
+            self._pending.setdefault(path, now)
+            if self._first_event is None:
+                self._first_event = now
+            self._last_event = now
+            self._cond.notify()
+    
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+    
+    def newer_batch_ready(self):
+        """진행 중인 재생성을 대체할 새 배치가 준비되었는지 (조용한 구간이 지났는지)
+        
+        max_latency는 보지 않습니다. 쉬지 않고 저장이 이어질 때 매번 취소되어
+        재생성이 끝나지 못하는 일이 없도록, 편집이 잠시 멈췄을 때만 취소합니다.
+        """
+        with self._cond:
+            return bool(self._pending) and time.monotonic() >= self._last_event + self.quiet_window
+    
+    def _requeue(self, batch):
+        """취소된 배치의 경로를 대기 중인 경로 앞에 합칩니다."""
+        now = time.monotonic()
+        with self._cond:
+            # 처음 이벤트 시각을 유지해 취소된 시간까지 지연 시간에 포함
+            merged = {path: self.batch_events.get(path, now) for path in batch}
+            for path, event_time in self._pending.items():
+                merged[path] = min(event_time, merged.get(path, event_time))
+            self._pending = merged
+            if self._first_event is None:
+                # 합칠 새 배치가 없으면 (subprocess가 다른 이유로 종료됨) 바로 다시 처리
+                self._first_event = self._last_event = now - self.quiet_window
+    
+    def _next_batch(self):
+        """조용한 구간이 끝나거나 최대 지연에 도달할 때까지 기다린 뒤 배치를 꺼냅니다."""
+        with self._cond:
+            while not self._stopped:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                deadline = min(self._last_event + self.quiet_window,
+                               self._first_event + self.max_latency)
+                if now >= deadline:
+                    batch = list(self._pending)
+                    self.batch_events = dict(self._pending)
+                    self.batch_dispatched = now
+                    self._pending.clear()
+                    self._first_event = self._last_event = None
+                    return batch
+                self._cond.wait(deadline - now)
+            return None
+    
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                if self.on_batch(batch, self.newer_batch_ready) is False:
+                    self._requeue(batch)
+            except Exception as e:
+                print(f"   ✗ 오류: {e}\n")
+
+
+# ============================================
+# 지연 시간 지표 (Prometheus 텍스트 형식)
+# ============================================
+
+class Histogram:
+    """Prometheus 형식의 누적 히스토그램 (초 단위)"""
+    
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    
+    def __init__(self):
+        self.bucket_counts = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.BUCKETS):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+    
+    def render(self, name):
+        lines = []
+        for bound, count in zip(self.BUCKETS, self.bucket_counts):
+            lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum {self.sum:.6f}")
+        lines.append(f"{name}_count {self.count}")
+        return lines
+
+
+class LatencyMetrics:
+    """재생성별 저장→HTML 지연 시간 기록
+    
+    단계별 히스토그램은 /metrics(Prometheus 텍스트 형식)로, 최근 재생성의 요약은 로그 한 줄로 보여 줍니다.
+    """
+    
+    PREFIX = "rexbox_docs"
+    STAGES = {
+        "queue_delay": "첫 파일 이벤트부터 재생성 시작까지 (debounce 대기 포함)",
+        "parse": "SCSS 파싱/추출 시간",
+        "render": "페이지 렌더링 시간 (파싱 제외)",
+        "write": "HTML 파일 쓰기 시간",
+        "total": "첫 파일 이벤트부터 HTML 쓰기 완료까지",
+    }
+    STAGE_LABELS = {"queue_delay": "대기", "parse": "파싱", "render": "렌더링", "write": "쓰기", "total": "전체"}
+    COUNTERS = {
+        "rebuilds": "완료된 재생성 수",
+        "rebuilds_cancelled": "새 변경으로 취소된 재생성 수",
+        "rebuilds_failed": "오류로 실패한 재생성 수",
+        "rebuilds_avoided": "내용이 바뀌지 않아 생략한 재생성 수",
+        "ignored_saves": "내용이 바뀌지 않아 무시한 저장 수",
+    }
+    
+    def __init__(self, window=50):
+        self._lock = threading.Lock()
+        self.histograms = {stage: Histogram() for stage in self.STAGES}
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.recent = collections.deque(maxlen=window)  # 최근 재생성의 전체 지연 시간
+        self.last = {}
+        self.last_event_timestamp = 0.0
+    
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+    
+    def observe(self, event_timestamp, **timings):
+        """재생성 한 번의 단계별 시간(초)을 기록합니다."""
+        with self._lock:
+            self.counters["rebuilds"] += 1
+            self.last_event_timestamp = event_timestamp
+            self.last = timings
+            for stage, value in timings.items():
+                self.histograms[stage].observe(value)
+            self.recent.append(timings["total"])
+    
+    def log_line(self):
+        """마지막 재생성의 단계별 시간과 최근 재생성의 전체 지연 시간 분포"""
+        with self._lock:
+            parts = [f"{self.STAGE_LABELS[stage]} {self.last[stage] * 1000:.0f}ms" for stage in self.STAGES]
+            recent = sorted(self.recent)
+        p50 = recent[len(recent) // 2]
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))]
+        return (f"   ⏱  {' · '.join(parts)} | 최근 {len(recent)}회 전체 "
+                f"p50 {p50 * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms, 최대 {recent[-1] * 1000:.0f}ms")
+    
+    def render_prometheus(self):
+        with self._lock:
+            lines = []
+            for stage, help_text in self.STAGES.items():
+                name = f"{self.PREFIX}_rebuild_{stage}_seconds"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                lines.extend(self.histograms[stage].render(name))
+            for counter, help_text in self.COUNTERS.items():
+                name = f"{self.PREFIX}_{counter}_total"
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name} {self.counters[counter]}")
+            name = f"{self.PREFIX}_last_event_timestamp_seconds"
+            lines.append(f"# HELP {name} 마지막으로 완료된 재생성의 첫 파일 이벤트 시각 (unix time)")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {self.last_event_timestamp:.3f}")
+        return "\n".join(lines) + "\n"
+
+
+def serve_metrics(metrics, port, host="127.0.0.1"):
+    """로컬 HTTP /metrics 엔드포인트를 백그라운드 스레드에서 시작합니다."""
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass  # 스크레이프마다 로그를 남기지 않음
+    
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
+
+
+class ContentDigests:
+    """감시 중인 SCSS 파일별 내용 digest
+    
+    save-all, 변경 없는 format-on-save처럼 내용이 그대로인 저장을 걸러냅니다.
+    새 digest는 재생성이 성공한 뒤에만 commit()으로 반영하므로, 취소되거나 실패해
+    다시 처리되어야 하는 경로가 '변경 없음'으로 빠지지 않습니다.
+    시작할 때 파일을 미리 읽지 않습니다. 처음 이벤트가 온 파일은 바뀐 것으로 보고
+    재생성하며(생성기는 빌드 매니페스트상 최신인 페이지를 렌더링하지 않음), 그때 digest를 기록합니다.
+    """
+    
+    MISSING = "missing"
+    
+    def __init__(self):
+        self._digests = {}  # 경로 문자열 -> digest
+    
+    @classmethod
+    def digest(cls, path):
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return cls.MISSING
+    
+    def changed(self, paths):
+        """내용이 바뀐 경로 목록과 반영할 digest를 반환합니다.
+        
+        디렉토리 경로(삭제/이동)는 항상 바뀐 것으로 보고, 그 아래 기록을 지웁니다.
+        """
+        changed, updates = [], {}
+        for path in paths:
+            key = str(path)
+            if os.path.isdir(key) or (key not in self._digests and not key.endswith(".scss")):
+                changed.append(path)
+                prefix = key.rstrip(os.sep) + os.sep
+                updates.update({p: None for p in self._digests if p.startswith(prefix)})
+                continue
+            digest = self.digest(key)
+            if self._digests.get(key) != digest:
+                changed.append(path)
+                updates[key] = digest
+        return changed, updates
+    
+    def commit(self, updates):
+        for key, digest in updates.items():
+            if digest is None or digest == self.MISSING:
+                self._digests.pop(key, None)
+            else:
+                self._digests[key] = digest
 
 
 class DocsHandler(FileSystemEventHandler):
     """SCSS 파일 변경 감지 핸들러"""
     
-    def __init__(self, script_path):
+    def __init__(self, script_path, generator=None, quiet_window=0.5, max_latency=3.0):
         self.script_path = script_path
-        self.last_modified = 0
-        self.debounce_time = 0.5  # 0.5초 debounce
+        # 상주 모드: 로드된 생성기 모듈 (None이면 변경마다 subprocess 실행)
+        self.generator = generator
+        # 내용이 바뀌지 않은 저장은 재생성하지 않음
+        self.digests = ContentDigests()
+        # 재생성별 지연 시간 (--metrics-port로 노출)
+        self.metrics = LatencyMetrics()
+        # 연속 저장은 모아서 마지막 상태로 한 번만 재생성
+        self.batcher = ChangeBatcher(self.rebuild, quiet_window, max_latency)
     
     def on_modified(self, event):
         """파일 수정 이벤트 처리"""
         if event.is_directory:
             return
+        self.queue(event.src_path)
+    
+    def on_created(self, event):
+        """새 파일(새 partial) 생성 이벤트 처리"""
+        if event.is_directory:
+            return
+        self.queue(event.src_path)
+    
+    def on_deleted(self, event):
+        """파일/디렉토리 삭제 이벤트 처리
         
+        삭제된 경로도 배치에 넣어 생성기가 해당 파일의 파싱 상태를 버리게 합니다.
+        """
+        self.queue(event.src_path, event.is_directory)
+    
+    def on_moved(self, event):
+        """이름 변경 이벤트 처리
+        
+        임시 파일에 쓰고 rename하는 에디터의 원자적 저장은 dest가 .scss인 move로 들어옵니다.
+        원래 경로와 새 경로를 모두 배치에 넣어 양쪽의 파싱 상태를 무효화합니다.
+        """
+        self.queue(event.src_path, event.is_directory)
+        self.queue(event.dest_path, event.is_directory)
+    
+    def queue(self, src_path, is_directory=False):
+        """관련 SCSS 경로면 재생성 배치에 추가"""
         # event.src_path를 Path 객체로 변환
-        file_path = Path(event.src_path)
+        file_path = Path(src_path)
         
-        # 관련 SCSS 파일만 처리
-        if not str(file_path).endswith(('.scss')):
+        # 관련 SCSS 파일만 처리 (디렉토리 삭제/이동은 그 아래 SCSS 전체에 영향)
+        if not is_directory and not str(file_path).endswith(('.scss')):
             return
         
         # docs 디렉토리 내 파일은 무시 (생성된 HTML 파일)
@@ -49,42 +397,433 @@ class DocsHandler(FileSystemEventHandler):
         if 'docs' in str(file_path) and 'scripts' not in str(file_path):
             return
         
-        # Debounce: 너무 빠른 연속 수정 방지
-        current_time = time.time()
-        if current_time - self.last_modified < self.debounce_time:
-            return
-        self.last_modified = current_time
-        
-        # 상대 경로 계산 (프로젝트 루트 기준)
+        self.batcher.add(file_path)
+    
+    def relative_path(self, file_path):
+        """상대 경로 계산 (프로젝트 루트 기준)"""
         try:
             # 프로젝트 루트는 rexbox/rexbox의 부모 디렉토리
             project_root = self.script_path.parent.parent.parent
-            rel_path = file_path.relative_to(project_root)
+            return file_path.relative_to(project_root)
         except (ValueError, AttributeError):
             # 상대 경로 변환 실패 시 절대 경로 사용
-            rel_path = file_path
-        print(f"\n📝 변경 감지: {rel_path}")
+            return file_path
+    
+    def rebuild(self, changed_paths, should_cancel):
+        """모인 변경 경로 전체로 한 번 재생성
+        
+        새 배치가 준비되어 중간에 취소되면 False를 반환합니다 (배처가 경로를 합쳐 다시 호출).
+        실패한 재생성은 digest를 반영하지 않으므로, 같은 내용으로 다시 저장해도 재시도합니다.
+        """
+        metrics = self.metrics
+        saved_paths = changed_paths
+        changed_paths, updates = self.digests.changed(saved_paths)
+        metrics.count("ignored_saves", len(saved_paths) - len(changed_paths))
+        if not changed_paths:
+            metrics.count("rebuilds_avoided")
+            print(f"   - 내용이 바뀌지 않은 저장 {len(saved_paths)}개 무시 "
+                  f"(생략한 재생성 {metrics.counters['rebuilds_avoided']}회, "
+                  f"무시한 저장 {metrics.counters['ignored_saves']}개)")
+            return True
+        
+        first_event = min(self.batcher.batch_events.values(), default=self.batcher.batch_dispatched)
+        started = time.monotonic()
+        
+        print()
+        for file_path in changed_paths:
+            print(f"📝 변경 감지: {self.relative_path(file_path)}")
         print("   문서 페이지 생성 중...")
         
+        if self.generator is not None:
+            status, phases = self.rebuild_in_process(changed_paths, should_cancel)
+        else:
+            status, phases = self.rebuild_subprocess(changed_paths, should_cancel)
+        if status == REBUILD_CANCELLED:
+            metrics.count("rebuilds_cancelled")
+            return False
+        if status == REBUILD_FAILED:
+            metrics.count("rebuilds_failed")
+            return True
+        
+        self.digests.commit(updates)
+        if phases is not None:
+            finished = time.monotonic()
+            metrics.observe(
+                event_timestamp=time.time() - (finished - first_event),
+                queue_delay=started - first_event,
+                total=finished - first_event,
+                **phases,
+            )
+            print(metrics.log_line() + "\n")
+        return True
+    
+    def rebuild_subprocess(self, changed_paths, should_cancel):
+        """변경마다 생성기 프로세스를 실행해 재생성
+        
+        (재생성 결과, 단계별 시간) 을 반환합니다. 시간을 읽지 못하면 단계별 시간은 None.
+        """
+        # 생성기가 단계별 시간을 표 없이 JSON으로만 저장
+        profile_path = self.script_path.parent.parent / ".cache" / "watch-profile.json"
+        phases = None
         try:
+            profile_path.unlink(missing_ok=True)
             # 스크립트 실행 (docs/ 디렉토리에서 실행)
-            result = subprocess.run(
-                [sys.executable, str(self.script_path)],
-                capture_output=True,
+            # --changed: 변경된 파일에 의존하는 페이지만 다시 생성
+            process = subprocess.Popen(
+                [sys.executable, str(self.script_path), "--changed", *map(str, changed_paths),
+                 "--profile-output", str(profile_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
                 cwd=str(self.script_path.parent.parent)  # docs/ 디렉토리
             )
+            while True:
+                try:
+                    stdout, stderr = process.communicate(timeout=self.batcher.quiet_window)
+                    break
+                except subprocess.TimeoutExpired:
+                    if should_cancel():
+                        # 생성기는 SIGTERM을 받으면 다음 페이지 경계에서 아무것도 쓰지 않고 종료
+                        process.terminate()
+                        stdout, stderr = process.communicate()
+                        break
             
-            if result.returncode == 0:
-                print("   ✓ 모든 문서 페이지가 업데이트되었습니다.\n")
+            if process.returncode == 0:
+                print(stdout.rstrip())
+                print("   ✓ 문서 페이지가 업데이트되었습니다.")
+                try:
+                    phases = json.loads(profile_path.read_text(encoding="utf-8"))["phases"]
+                except (OSError, ValueError, KeyError):
+                    print()  # 의존하는 페이지가 없어 빌드하지 않은 경우
+            elif process.returncode in (EXIT_CANCELLED, -signal.SIGTERM):
+                print("   ↻ 새 변경이 들어와 재생성을 취소하고 다시 시작합니다.")
+                return REBUILD_CANCELLED, None
             else:
-                print(f"   ✗ 오류 발생:\n{result.stderr}\n")
+                print(f"   ✗ 오류 발생:\n{stderr}\n")
+                return REBUILD_FAILED, None
+        except Exception as e:
+            print(f"   ✗ 오류: {e}\n")
+            return REBUILD_FAILED, None
+        return REBUILD_DONE, phases
+    
+    def rebuild_in_process(self, changed_paths, should_cancel):
+        """상주 모드: 메모리에 유지된 파싱 상태로 바로 재생성
+        
+        (재생성 결과, 단계별 시간) 을 반환합니다.
+        """
+        profiler = self.generator.BuildProfiler()
+        try:
+            pages, changed = self.generator.rebuild(changed_paths, should_cancel=should_cancel, profiler=profiler)
+            if pages:
+                if changed:
+                    print(f"   ✓ {changed}개 문서 페이지가 업데이트되었습니다.")
+                else:
+                    print("   - 내용이 바뀐 문서 페이지가 없습니다.")
+                return REBUILD_DONE, profiler.phase_totals()
+            print("   - 변경된 파일에 의존하는 문서 페이지가 없습니다.\n")
+        except self.generator.BuildCancelled:
+            print("   ↻ 새 변경이 들어와 재생성을 취소하고 다시 시작합니다.")
+            return REBUILD_CANCELLED, None
         except Exception as e:
             print(f"   ✗ 오류: {e}\n")
+            return REBUILD_FAILED, None
+        return REBUILD_DONE, None
+
+
+# ============================================
+# inotify 백엔드 (Linux, 의존성 없음)
+# ============================================
+
+# watchdog 이벤트와 같은 속성을 가진 이벤트 객체
+FileEvent = collections.namedtuple("FileEvent", "src_path dest_path is_directory")
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+INOTIFY_WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                      IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def inotify_available():
+    return sys.platform.startswith("linux") and ctypes.util.find_library("c") is not None
+
+
+class InotifyObserver:
+    """ctypes로 Linux inotify를 사용하는 감시자 (watchdog Observer와 같은 start/stop/join 인터페이스)
+    
+    디렉토리마다 watch를 재귀적으로 등록하고, 새로 생긴 디렉토리도 자동으로 등록합니다.
+    이벤트 스레드는 select()로 커널 이벤트를 기다리며 주기적으로 깨어나지 않습니다.
+    """
+    
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+        self.fd = libc.inotify_init1(IN_CLOEXEC | IN_NONBLOCK)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 실패: {os.strerror(err)}")
+        self._wake_r, self._wake_w = os.pipe()
+        self._watches = {}  # wd -> 디렉토리 경로
+        self._roots = []
+        self._handler = None
+        self._thread = None
+    
+    def schedule(self, handler, path, recursive=True):
+        self._handler = handler
+        self._roots.append(path)
+        self._add_tree(path) if recursive else self._add_dir(path)
+    
+    def _add_dir(self, path):
+        wd = self._add_watch(self.fd, os.fsencode(path), INOTIFY_WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(err, f"inotify_add_watch 실패 ({path}): {os.strerror(err)}")
+        self._watches[wd] = path
+    
+    def _add_tree(self, path, report_files=False):
+        """path와 하위 디렉토리를 모두 등록합니다.
+        
+        report_files가 True면 (새로 생긴 디렉토리) watch 등록 전에 이미 만들어진 파일을 생성 이벤트로 알립니다.
+        """
+        for dirpath, dirnames, filenames in os.walk(path):
+            self._add_dir(dirpath)
+            if report_files:
+                for filename in filenames:
+                    self._handler.on_created(FileEvent(os.path.join(dirpath, filename), None, False))
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="inotify", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        os.write(self._wake_w, b"x")
+    
+    def join(self):
+        if self._thread is not None:
+            self._thread.join()
+        os.close(self.fd)
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+    
+    def _run(self):
+        while True:
+            readable, _, _ = select.select([self.fd, self._wake_r], [], [])
+            if self._wake_r in readable:
+                return
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            try:
+                self._dispatch(data)
+            except Exception as e:
+                print(f"   ✗ inotify 이벤트 처리 오류: {e}\n")
+    
+    def _dispatch(self, data):
+        handler = self._handler
+        moved_from = {}  # cookie -> (경로, 디렉토리 여부)
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+            offset += INOTIFY_EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            
+            if mask & IN_Q_OVERFLOW:
+                # 이벤트가 유실되었으므로 감시 중인 전체 트리를 변경된 것으로 처리
+                for root in self._roots:
+                    handler.queue(root, True)
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, os.fsdecode(name)) if name else directory
+            is_dir = bool(mask & IN_ISDIR)
+            
+            if mask & IN_CREATE:
+                if is_dir:
+                    self._add_tree(path, report_files=True)
+                else:
+                    handler.on_created(FileEvent(path, None, False))
+            elif mask & (IN_MODIFY | IN_CLOSE_WRITE):
+                handler.on_modified(FileEvent(path, None, is_dir))
+            elif mask & IN_DELETE:
+                handler.on_deleted(FileEvent(path, None, is_dir))
+            elif mask & IN_MOVED_FROM:
+                moved_from[cookie] = (path, is_dir)
+            elif mask & IN_MOVED_TO:
+                source = moved_from.pop(cookie, None)
+                if source is not None:
+                    handler.on_moved(FileEvent(source[0], path, is_dir))
+                else:
+                    handler.on_created(FileEvent(path, None, is_dir))
+                if is_dir:
+                    # 감시 범위 밖에서 들어온 디렉토리면 안의 파일도 새 파일로 알림
+                    self._add_tree(path, report_files=source is None)
+        
+        # 짝이 없는 MOVED_FROM은 감시 범위 밖으로 나간 것이므로 삭제로 처리
+        for src_path, is_dir in moved_from.values():
+            handler.on_deleted(FileEvent(src_path, None, is_dir))
+
+
+# ============================================
+# polling 백엔드 (stat 인덱스)
+# ============================================
+
+class PollingObserver:
+    """*.scss 파일의 (inode, mtime_ns, size) 인덱스를 주기적으로 다시 훑는 감시자
+    
+    os.scandir의 stat 결과만 비교하고 파일 내용은 읽지 않습니다.
+    사라진 경로의 stat이 그대로 새 경로에 나타나면 이름 변경으로 처리합니다.
+    """
+    
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self._roots = []
+        self._index = {}  # 경로 -> (inode, mtime_ns, size)
+        self._handler = None
+        self._stopped = threading.Event()
+        self._thread = None
+    
+    def schedule(self, handler, path, recursive=True):
+        self._handler = handler
+        self._roots.append(path)
+        self._index.update(self.scan(path))
+    
+    @staticmethod
+    def scan(root):
+        """root 아래 모든 *.scss 파일의 stat 인덱스"""
+        index = {}
+        stack = [root]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".scss"):
+                            st = entry.stat()
+                            index[entry.path] = (st.st_ino, st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        return index
+    
+    def poll(self):
+        """한 번 다시 훑어 변경을 핸들러에 알립니다."""
+        current = {}
+        for root in self._roots:
+            current.update(self.scan(root))
+        previous, self._index = self._index, current
+        
+        removed = {path: stat for path, stat in previous.items() if path not in current}
+        # rename은 inode/mtime/size를 그대로 유지함 (삭제 후 재사용된 inode와 구분)
+        removed_by_stat = {stat: path for path, stat in removed.items()}
+        handler = self._handler
+        for path, stat in current.items():
+            old = previous.get(path)
+            if old is None:
+                src_path = removed_by_stat.pop(stat, None)
+                if src_path is not None:
+                    del removed[src_path]
+                    handler.on_moved(FileEvent(src_path, path, False))
+                else:
+                    handler.on_created(FileEvent(path, None, False))
+            elif old != stat:
+                handler.on_modified(FileEvent(path, None, False))
+        for path in removed:
+            handler.on_deleted(FileEvent(path, None, False))
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="polling", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stopped.set()
+    
+    def join(self):
+        if self._thread is not None:
+            self._thread.join()
+    
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"   ✗ polling 오류: {e}\n")
+
+
+def create_observer(backend, poll_interval=1.0):
+    """선택한 백엔드의 감시자를 만듭니다. 사용할 수 없으면 None.
+    
+    auto는 inotify → watchdog → polling 순으로 사용할 수 있는 첫 백엔드를 고릅니다.
+    """
+    if backend == "auto":
+        if inotify_available():
+            try:
+                return InotifyObserver(), "inotify"
+            except OSError as e:
+                print(f"⚠️  inotify를 사용할 수 없어 polling으로 전환합니다: {e}")
+                return PollingObserver(poll_interval), "polling"
+        backend = "watchdog" if WATCHDOG_AVAILABLE else "polling"
+    if backend == "polling":
+        return PollingObserver(poll_interval), backend
+    if backend == "inotify":
+        if not inotify_available():
+            print("⚠️  inotify는 Linux에서만 사용할 수 있습니다.")
+            return None, backend
+        return InotifyObserver(), backend
+    if not WATCHDOG_AVAILABLE:
+        print_watchdog_install_help()
+        return None, backend
+    return Observer(), backend
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="RexBox 문서 파일 감시")
+    parser.add_argument("--resident", action="store_true",
+                        help="생성기를 한 번만 로드하고 파싱 상태를 메모리에 유지합니다 (변경마다 프로세스를 띄우지 않음).")
+    parser.add_argument("--quiet-window", type=float, default=0.5, metavar="SEC",
+                        help="마지막 변경 후 이 시간 동안 조용하면 모인 변경을 한 번에 처리합니다 (기본값: 0.5초).")
+    parser.add_argument("--max-latency", type=float, default=3.0, metavar="SEC",
+                        help="변경이 계속 들어와도 첫 변경 후 이 시간이 지나면 재생성합니다 (기본값: 3초).")
+    parser.add_argument("--backend", choices=["auto", "inotify", "watchdog", "polling"], default="auto",
+                        help="파일 감시 백엔드 (기본값: auto - Linux는 inotify, 그 외는 watchdog, 둘 다 없으면 polling)")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="지정하면 127.0.0.1:PORT/metrics 에서 재생성 지연 시간 지표를 Prometheus 형식으로 제공합니다.")
+    parser.add_argument("--poll-interval", type=float, default=1.0, metavar="SEC",
+                        help="polling 백엔드의 재검사 간격 (기본값: 1초)")
+    return parser.parse_args()
 
 
 def main():
     """메인 함수"""
+    args = parse_args()
     root_dir = Path(__file__).parent.parent.parent / "rexbox"
     script_path = Path(__file__).parent / "generate-docs.py"
     
@@ -98,18 +837,31 @@ def main():
         root_dir / "utilities",
     ]
     
-    print("👀 SCSS 파일 감시 시작...")
+    observer, backend = create_observer(args.backend, args.poll_interval)
+    if observer is None:
+        sys.exit(1)
+    
+    print(f"👀 SCSS 파일 감시 시작... ({backend})")
     print("   감시 디렉토리:")
     for watch_dir in watch_dirs:
         if watch_dir.exists():
             print(f"   - {watch_dir.relative_to(root_dir)}")
     print("\n   Ctrl+C를 눌러 종료하세요.\n")
     
+    generator = None
+    if args.resident:
+        print("   상주 모드: 생성기를 메모리에 로드합니다.\n")
+        generator = load_generator(script_path)
+    
     # 이벤트 핸들러 생성
-    event_handler = DocsHandler(script_path)
+    event_handler = DocsHandler(script_path, generator, args.quiet_window, args.max_latency)
+    
+    metrics_server = None
+    if args.metrics_port:
+        metrics_server = serve_metrics(event_handler.metrics, args.metrics_port)
+        print(f"   지표: http://127.0.0.1:{args.metrics_port}/metrics\n")
     
-    # Observer 생성 및 시작
-    observer = Observer()
+    # Observer 등록 및 시작
     for watch_dir in watch_dirs:
         if watch_dir.exists():
             observer.schedule(event_handler, str(watch_dir), recursive=True)
@@ -124,6 +876,9 @@ def main():
         observer.stop()
     
     observer.join()
+    event_handler.batcher.stop()
+    if metrics_server is not None:
+        metrics_server.shutdown()
 
 
 if __name__ == "__main__":